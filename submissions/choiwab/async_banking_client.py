@@ -0,0 +1,538 @@
+"""
+Async Banking Client - Python 3.11+
+asyncio/aiohttp counterpart of BankingClient for concurrent API fan-out.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from typing import Optional, Dict, Any, Iterable, List, Mapping, Set
+import aiohttp
+import orjson
+
+from banking_client import (
+    BankingClient,
+    TransferRequest,
+    TransferResponse,
+    _BASE_HEADERS,
+    _auth_header_value,
+    _auth_headers,
+    _build_urls,
+    _cache_token,
+    _get_cached_token,
+    _token_cache_key,
+    _token_expiry,
+)
+from config import get_config
+
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on in-flight requests so gathered calls never saturate the connector
+MAX_CONCURRENCY = 50
+
+# Statuses meaning the server has no bulk validation endpoint
+_BULK_UNSUPPORTED_STATUSES = frozenset({404, 405})
+
+# Error detail in the 500 the bundled server's catch-all handler sends for a missing route
+_MISSING_ROUTE_MARKERS = ("is not supported", "No static resource")
+
+# Base URLs whose server turned out to lack the bulk endpoint, so later clients
+# (e.g. each call of the validate_accounts facade) skip the failed probe
+_BULK_VALIDATE_UNSUPPORTED: Set[str] = set()
+
+# Transient statuses retried by _request (same set as the sync Retry strategy)
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class AsyncBankingClient:
+    """
+    Asynchronous Banking API Client built on a single long-lived aiohttp session.
+
+    Features:
+    - Coroutines that can be combined with asyncio.gather for concurrent calls
+    - Shared keep-alive connection pool (TCPConnector) for the client lifetime
+    - Semaphore-bounded concurrency to avoid connector saturation
+    - Non-blocking retry with full-jitter backoff on transient errors
+    - JWT token management mirroring BankingClient
+    """
+
+    def __init__(self, base_url: str = "http://localhost:8123", timeout: int = 10,
+                 max_concurrency: int = MAX_CONCURRENCY,
+                 limit_per_host: Optional[int] = None):
+        """
+        Initialize the Async Banking Client.
+
+        Args:
+            base_url: Base URL of the banking API
+            timeout: Total request timeout in seconds
+            max_concurrency: Maximum number of concurrent outbound requests
+            limit_per_host: Maximum open connections to the API host
+                (defaults to the configured pool_maxsize)
+        """
+        self.base_url = BankingClient._normalize_base_url(base_url)
+        self.timeout = timeout
+        self.limit_per_host = limit_per_host or get_config().pool_maxsize
+        self._urls = _build_urls(self.base_url)
+        self.token: Optional[str] = None
+        # time.monotonic() deadline, immune to wall-clock adjustments
+        self.token_expiry: Optional[float] = None
+
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        # Serializes token refresh so gathered calls share a single /authToken request
+        self._auth_lock = asyncio.Lock()
+
+        logger.info("AsyncBankingClient initialized with base_url: %s", self.base_url)
+
+    @property
+    def token(self) -> Optional[str]:
+        """Current JWT token, if authenticated."""
+        return self._token
+
+    @token.setter
+    def token(self, value: Optional[str]) -> None:
+        self._token = value
+        self._auth_header_value = _auth_header_value(value)
+        self._headers_auth = _auth_headers(self._auth_header_value)
+
+    async def __aenter__(self) -> 'AsyncBankingClient':
+        """Async context manager entry, opens the shared aiohttp session."""
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, limit_per_host=self.limit_per_host,
+                                           keepalive_timeout=60),
+            timeout=aiohttp.ClientTimeout(total=self.timeout)
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the aiohttp session and cleanup resources."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+            logger.info("AsyncBankingClient session closed")
+
+    async def _request(self, method: str, url: str, retry: bool = True,
+                       **kwargs: Any) -> Dict[str, Any]:
+        """
+        Issue a request through the shared session and decode the JSON body.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            retry: Whether to retry transient error statuses
+            **kwargs: Extra arguments forwarded to aiohttp
+
+        Returns:
+            Decoded JSON response
+
+        Raises:
+            RuntimeError: If the client is used outside 'async with'
+            aiohttp.ClientResponseError: If the API returns an error status
+        """
+        if self._session is None:
+            raise RuntimeError("AsyncBankingClient must be used with 'async with'")
+
+        # urllib3's Retry sleeps the calling thread, so transient errors are
+        # retried here with asyncio.sleep and full jitter instead
+        config = get_config()
+        retries = max(config.max_retries, 0) if retry else 0
+        for attempt in range(retries):
+            try:
+                return await self._send(self._session, method, url, **kwargs)
+            except aiohttp.ClientResponseError as e:
+                if e.status not in _RETRY_STATUSES:
+                    raise
+                delay = random.uniform(0, config.backoff_factor * 2 ** attempt)
+                logger.info("%s %s returned %s, retrying in %.2fs", method, url, e.status, delay)
+                # Sleep outside the semaphore so waiting retries don't hold a slot
+                await asyncio.sleep(delay)
+
+        # Final attempt, its error propagates whatever the status
+        return await self._send(self._session, method, url, **kwargs)
+
+    async def _send(self, session: aiohttp.ClientSession, method: str, url: str,
+                    **kwargs: Any) -> Dict[str, Any]:
+        """Send one request within the concurrency limit and decode the JSON body."""
+        async with self._semaphore:
+            async with session.request(method, url, **kwargs) as r:
+                if not r.ok:
+                    # raise_for_status() would drop the body, which carries the server's reason
+                    raise aiohttp.ClientResponseError(
+                        r.request_info, r.history, status=r.status,
+                        message=(await r.read()).decode(errors="replace"),
+                        headers=r.headers
+                    )
+                data: Dict[str, Any] = orjson.loads(await r.read())
+                return data
+
+    async def authenticate(self, username: str = "alice", password: str = "secret",
+                           scope: str = "transfer") -> str:
+        """
+        Authenticate and get JWT token with specified scope.
+
+        Shares the process-wide token cache with BankingClient.
+
+        Args:
+            username: Username for authentication
+            password: Password for authentication
+            scope: Token scope ('enquiry' or 'transfer')
+
+        Returns:
+            JWT token string
+
+        Raises:
+            aiohttp.ClientResponseError: If authentication fails
+            ValueError: If the response does not contain a token
+        """
+        cache_key = _token_cache_key(self.base_url, username, password, scope)
+        cached = _get_cached_token(cache_key)
+        if cached is not None:
+            self.token, self.token_expiry = cached
+            logger.info("Using cached token for user '%s' with scope '%s'", username, scope)
+            return self.token
+
+        logger.info("Authenticating user '%s' with scope '%s'", username, scope)
+
+        try:
+            data = await self._request(
+                "POST", self._urls["auth"],
+                data=orjson.dumps({"username": username, "password": password}),
+                headers=self._get_headers(),
+                params={"claim": scope}
+            )
+            token: Optional[str] = data.get('token')
+            if not token:
+                raise ValueError("Authentication response did not include a token")
+
+            self.token = token
+            self.token_expiry = _token_expiry(token)
+            _cache_token(cache_key, token, self.token_expiry)
+
+            logger.info("Authentication successful")
+            return token
+
+        except aiohttp.ClientResponseError as e:
+            logger.error("Authentication failed: %s", e)
+            raise
+
+    async def _ensure_authenticated(self, scope: str = "transfer") -> None:
+        """
+        Ensure valid JWT token exists, refresh if needed.
+
+        Args:
+            scope: Required token scope
+        """
+        if self._token_valid():
+            return
+
+        async with self._auth_lock:
+            # Another coroutine may have refreshed the token while this one waited
+            if not self._token_valid():
+                logger.info("Token expired or missing, re-authenticating")
+                await self.authenticate(scope=scope)
+
+    def _token_valid(self) -> bool:
+        """Whether a token is held and its expiry deadline has not passed."""
+        return bool(self.token) and (self.token_expiry is None
+                                     or time.monotonic() < self.token_expiry)
+
+    def _get_headers(self, use_auth: bool = False) -> Mapping[str, str]:
+        """
+        Get request headers, optionally with authentication.
+
+        Args:
+            use_auth: Whether to include Authorization header
+
+        Returns:
+            Read-only mapping of headers
+        """
+        return self._headers_auth if use_auth else _BASE_HEADERS
+
+    async def transfer(self, from_account: str, to_account: str, amount: float,
+                       use_auth: bool = True) -> TransferResponse:
+        """
+        Transfer funds between accounts.
+
+        Args:
+            from_account: Source account ID (e.g., 'ACC1000')
+            to_account: Destination account ID (e.g., 'ACC1001')
+            amount: Transfer amount (must be positive)
+            use_auth: Whether to use JWT authentication
+
+        Returns:
+            TransferResponse object with transaction details
+
+        Raises:
+            ValueError: If input validation fails
+            aiohttp.ClientResponseError: If API request fails
+        """
+        transfer_req = TransferRequest(from_account, to_account, amount)
+        transfer_req.validate()
+
+        if use_auth:
+            await self._ensure_authenticated(scope="transfer")
+
+        logger.info("Initiating transfer: %s -> %s, amount: %s", from_account, to_account, amount)
+
+        try:
+            data = await self._request(
+                "POST", self._urls["transfer"],
+                data=orjson.dumps(transfer_req.to_dict()),
+                headers=self._get_headers(use_auth=use_auth)
+            )
+            transfer_resp = TransferResponse.from_dict(data)
+
+            logger.info("Transfer successful: %s", transfer_resp.transaction_id)
+            return transfer_resp
+
+        except aiohttp.ClientResponseError as e:
+            logger.error("Transfer failed with HTTP error: %s", e)
+            raise
+
+    async def transfer_many(self, reqs: Iterable[Dict[str, Any]]) -> List[TransferResponse]:
+        """
+        Run several transfers concurrently.
+
+        Args:
+            reqs: Keyword arguments for each transfer() call
+
+        Returns:
+            TransferResponse objects in the order of reqs
+        """
+        return await asyncio.gather(*[self.transfer(**r) for r in reqs])
+
+    async def validate_account(self, account_id: str) -> Dict[str, Any]:
+        """
+        Validate if an account exists and is active.
+
+        Args:
+            account_id: Account ID to validate
+
+        Returns:
+            Account validation response
+        """
+        logger.info("Validating account: %s", account_id)
+
+        try:
+            data = await self._request(
+                "GET", self._urls["validate"] + account_id,
+                headers=self._get_headers()
+            )
+            logger.info("Account %s validation result: %s", account_id, data.get('isValid'))
+            return data
+
+        except aiohttp.ClientResponseError as e:
+            logger.error("Account validation failed: %s", e)
+            raise
+
+    async def validate_accounts(self, account_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Validate several accounts, in a single request when the server supports it.
+
+        POSTs the IDs to /accounts/validate/bulk, which is expected to answer
+        {"accounts": [<validation response>, ...]}; IDs missing from the reply
+        are validated with validate_account(). The probe is not retried. If
+        the endpoint does not exist, the accounts are validated with
+        concurrent validate_account() calls and the bulk endpoint is not tried
+        again for this base URL; other 5xx errors fall back for this call only.
+
+        Args:
+            account_ids: Account IDs to validate
+
+        Returns:
+            Validation responses keyed by account ID, in request order
+        """
+        account_ids = list(account_ids)
+
+        if self.base_url not in _BULK_VALIDATE_UNSUPPORTED:
+            logger.info("Validating %d accounts in bulk", len(account_ids))
+            try:
+                data = await self._request(
+                    "POST", self._urls["validate_bulk"],
+                    retry=False,
+                    data=orjson.dumps({"accountIds": account_ids}),
+                    headers=self._get_headers()
+                )
+                by_id = {a.get('accountId'): a for a in data.get('accounts', [])}
+                missing = [a for a in dict.fromkeys(account_ids) if a not in by_id]
+                if missing:
+                    logger.info("Bulk reply lacked %d accounts, validating them individually",
+                                len(missing))
+                    results = await asyncio.gather(*(self.validate_account(a) for a in missing))
+                    by_id.update(zip(missing, results))
+                return {account_id: by_id[account_id] for account_id in account_ids}
+
+            except aiohttp.ClientResponseError as e:
+                # The bundled server reports the missing route as a 500 from its
+                # catch-all handler rather than 404/405, so recognise it by its detail
+                if e.status in _BULK_UNSUPPORTED_STATUSES or (
+                        e.status == 500 and any(m in e.message for m in _MISSING_ROUTE_MARKERS)):
+                    logger.info("Bulk validation unsupported (%s), validating accounts "
+                                "individually", e.status)
+                    _BULK_VALIDATE_UNSUPPORTED.add(self.base_url)
+                elif e.status >= 500:
+                    # Possibly transient, so fall back without ruling out the endpoint
+                    logger.warning("Bulk account validation failed (%s), validating accounts "
+                                   "individually", e.status)
+                else:
+                    logger.error("Bulk account validation failed: %s", e)
+                    raise
+
+        results = await asyncio.gather(*(self.validate_account(a) for a in account_ids))
+        return dict(zip(account_ids, results))
+
+    async def get_balance(self, account_id: str, use_auth: bool = False) -> Dict[str, Any]:
+        """
+        Get account balance.
+
+        Args:
+            account_id: Account ID
+            use_auth: Whether to use JWT authentication
+
+        Returns:
+            Balance information
+        """
+        if use_auth:
+            await self._ensure_authenticated(scope="enquiry")
+
+        logger.info("Getting balance for account: %s", account_id)
+
+        try:
+            data = await self._request(
+                "GET", self._urls["balance"] + account_id,
+                headers=self._get_headers(use_auth=use_auth)
+            )
+            logger.info("Balance for %s: %s", account_id, data.get('balance'))
+            return data
+
+        except aiohttp.ClientResponseError as e:
+            logger.error("Get balance failed: %s", e)
+            raise
+
+    async def get_all_balances(self, use_auth: bool = False) -> List[Dict[str, Any]]:
+        """
+        List all accounts and fetch their balances concurrently.
+
+        Args:
+            use_auth: Whether to use JWT authentication
+
+        Returns:
+            Accounts with the fields of their balance response merged in
+        """
+        accounts = (await self.list_accounts(use_auth=use_auth)).get('accounts', [])
+        balances = await asyncio.gather(
+            *(self.get_balance(a['accountId'], use_auth=use_auth) for a in accounts)
+        )
+        return [{**account, **balance} for account, balance in zip(accounts, balances)]
+
+    async def list_accounts(self, use_auth: bool = False) -> Dict[str, Any]:
+        """
+        List all accounts.
+
+        Args:
+            use_auth: Whether to use JWT authentication
+
+        Returns:
+            List of accounts
+        """
+        if use_auth:
+            await self._ensure_authenticated(scope="enquiry")
+
+        logger.info("Listing all accounts")
+
+        try:
+            return await self._request(
+                "GET", self._urls["accounts"],
+                headers=self._get_headers(use_auth=use_auth)
+            )
+
+        except aiohttp.ClientResponseError as e:
+            logger.error("List accounts failed: %s", e)
+            raise
+
+    async def get_transaction_history(self) -> Dict[str, Any]:
+        """
+        Get transaction history (requires authentication).
+
+        Returns:
+            Transaction history
+        """
+        await self._ensure_authenticated(scope="transfer")
+
+        logger.info("Getting transaction history")
+
+        try:
+            return await self._request(
+                "GET", self._urls["history"],
+                headers=self._get_headers(use_auth=True)
+            )
+
+        except aiohttp.ClientResponseError as e:
+            logger.error("Get transaction history failed: %s", e)
+            raise
+
+
+def transfer_many(reqs: Iterable[Dict[str, Any]], base_url: str = "http://localhost:8123",
+                  timeout: int = 10) -> List[TransferResponse]:
+    """
+    Synchronous facade over AsyncBankingClient.transfer_many for non-async callers.
+
+    Args:
+        reqs: Keyword arguments for each transfer() call
+        base_url: Base URL of the banking API
+        timeout: Total request timeout in seconds
+
+    Returns:
+        TransferResponse objects in the order of reqs
+    """
+    async def _run() -> List[TransferResponse]:
+        async with AsyncBankingClient(base_url=base_url, timeout=timeout) as client:
+            return await client.transfer_many(reqs)
+
+    return asyncio.run(_run())
+
+
+def get_all_balances(base_url: str = "http://localhost:8123", timeout: int = 10,
+                     use_auth: bool = False) -> List[Dict[str, Any]]:
+    """
+    Synchronous facade over AsyncBankingClient.get_all_balances for non-async callers.
+
+    Args:
+        base_url: Base URL of the banking API
+        timeout: Total request timeout in seconds
+        use_auth: Whether to use JWT authentication
+
+    Returns:
+        Accounts with the fields of their balance response merged in
+    """
+    async def _run() -> List[Dict[str, Any]]:
+        async with AsyncBankingClient(base_url=base_url, timeout=timeout) as client:
+            return await client.get_all_balances(use_auth=use_auth)
+
+    return asyncio.run(_run())
+
+
+def validate_accounts(account_ids: Iterable[str], base_url: str = "http://localhost:8123",
+                      timeout: int = 10) -> Dict[str, Dict[str, Any]]:
+    """
+    Synchronous facade over AsyncBankingClient.validate_accounts for non-async callers.
+
+    Args:
+        account_ids: Account IDs to validate
+        base_url: Base URL of the banking API
+        timeout: Total request timeout in seconds
+
+    Returns:
+        Validation responses keyed by account ID, in request order
+    """
+    async def _run() -> Dict[str, Dict[str, Any]]:
+        async with AsyncBankingClient(base_url=base_url, timeout=timeout) as client:
+            return await client.validate_accounts(account_ids)
+
+    return asyncio.run(_run())
@@ -3,25 +3,149 @@ Modern Banking Client - Python 3.11+
 Modernized from legacy Python 2.7 code with best practices.
 """
 
-import json
+import base64
+import functools
+import hashlib
 import logging
+import math
+import os
+import re
+import ssl
+import threading
+import time
+from array import array
 from dataclasses import dataclass
-from typing import Optional, Dict, Any
-from datetime import datetime, timedelta
+from types import MappingProxyType
+from typing import Optional, Dict, Any, List, Mapping, Tuple, Union, TYPE_CHECKING
+import orjson
 import requests
+from cachetools import TTLCache
 from requests.adapters import HTTPAdapter
+from requests.utils import DEFAULT_CA_BUNDLE_PATH
+from urllib3.util.request import ACCEPT_ENCODING
 from urllib3.util.retry import Retry
 
+from config import BankingConfig, get_config
+
+if TYPE_CHECKING:
+    from requests.adapters import _HostParams, _PoolKwargs
+
+try:
+    from requests_cache import DEFAULT_IGNORED_PARAMS, DO_NOT_CACHE, CachedSession
+except ImportError:  # requests-cache is optional
+    CachedSession = None  # type: ignore[assignment,misc]
+
+# Seconds a cached GET response (validate/balance/list accounts) stays fresh
+_RESPONSE_CACHE_TTL = 5
+
+# The only responses worth caching: list accounts, validate and balance lookups
+_CACHED_URL_RE = re.compile(r"/accounts(/validate/[^/?]+|/balance/[^/?]+)?(\?|$)")
+
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
+# Account IDs are 'ACC' followed by ASCII digits only (\d would accept any Unicode digit)
+_ACC_RE = re.compile(r"ACC[0-9]+")
+
+# Immutable header template shared by every unauthenticated request;
+# ACCEPT_ENCODING only advertises br/zstd when their decoders are installed
+_BASE_HEADERS: Mapping[str, str] = MappingProxyType({
+    "Content-Type": "application/json",
+    "Accept-Encoding": ACCEPT_ENCODING,
+})
+
+
+def _build_urls(base_url: str) -> Dict[str, str]:
+    """Precompute endpoint URLs; 'validate' and 'balance' take an account ID suffix."""
+    return {
+        "auth": f"{base_url}/authToken",
+        "transfer": f"{base_url}/transfer",
+        "accounts": f"{base_url}/accounts",
+        "validate": f"{base_url}/accounts/validate/",
+        "validate_bulk": f"{base_url}/accounts/validate/bulk",
+        "balance": f"{base_url}/accounts/balance/",
+        "history": f"{base_url}/transactions/history",
+    }
+
+
+def _auth_header_value(token: Optional[str]) -> Optional[str]:
+    """Format the Authorization header value for a token, if any."""
+    return f"Bearer {token}" if token else None
+
+
+def _auth_headers(auth_header_value: Optional[str]) -> Mapping[str, str]:
+    """Build the immutable header mapping used for authenticated requests."""
+    if auth_header_value is None:
+        return _BASE_HEADERS
+    return MappingProxyType({**_BASE_HEADERS, "Authorization": auth_header_value})
+
+
+# Process-wide JWT cache shared by every client instance
+_TOKEN_CACHE: TTLCache[Tuple[str, str, str, str], Tuple[str, float]] = TTLCache(
+    maxsize=256, ttl=3300
+)
+# cachetools caches are not thread-safe (even get() evicts expired entries)
+_TOKEN_CACHE_LOCK = threading.Lock()
+
+# Cached tokens are dropped this many seconds before their 'exp' claim
+_TOKEN_EXPIRY_MARGIN = 30.0
+
+
+def _token_cache_key(base_url: str, username: str, password: str,
+                     scope: str) -> Tuple[str, str, str, str]:
+    """Build the token cache key without keeping the plain-text password."""
+    return (base_url, username, hashlib.sha256(password.encode()).hexdigest(), scope)
+
+
+def _token_expiry(token: str) -> float:
+    """
+    Read the expiry time from the JWT 'exp' claim.
+
+    Args:
+        token: Encoded JWT
+
+    Returns:
+        Expiry as a time.monotonic() deadline, or one hour from now if the
+        claim cannot be read
+    """
+    try:
+        payload = token.split('.')[1]
+        claims = orjson.loads(base64.urlsafe_b64decode(payload + '=' * (-len(payload) % 4)))
+        ttl_seconds = int(claims['exp']) - time.time()
+    except (IndexError, KeyError, TypeError, ValueError):
+        ttl_seconds = 3600.0
+
+    return time.monotonic() + ttl_seconds
+
+
+def _get_cached_token(key: Tuple[str, str, str, str]) -> Optional[Tuple[str, float]]:
+    """Return a cached (token, expiry) pair that is still valid, if any."""
+    with _TOKEN_CACHE_LOCK:
+        entry = _TOKEN_CACHE.get(key)
+        if entry is None:
+            return None
+
+        if time.monotonic() >= entry[1] - _TOKEN_EXPIRY_MARGIN:
+            _TOKEN_CACHE.pop(key, None)
+            return None
+
+        return entry
 
-@dataclass
+
+def _parse(response: requests.Response) -> Dict[str, Any]:
+    """Decode a JSON response body with orjson."""
+    data: Dict[str, Any] = orjson.loads(response.content)
+    return data
+
+
+def _cache_token(key: Tuple[str, str, str, str], token: str, expiry: float) -> None:
+    """Store a freshly issued token unless it is already about to expire."""
+    if time.monotonic() < expiry - _TOKEN_EXPIRY_MARGIN:
+        with _TOKEN_CACHE_LOCK:
+            _TOKEN_CACHE[key] = (token, expiry)
+
+
+@dataclass(slots=True, frozen=True)
 class TransferRequest:
     """Data model for transfer requests."""
     from_account: str
@@ -41,17 +165,17 @@ class TransferRequest:
         if not self.from_account or not self.to_account:
             raise ValueError("Both from_account and to_account are required")
 
-        if not self.from_account.startswith("ACC"):
+        if not _ACC_RE.fullmatch(self.from_account):
             raise ValueError(f"Invalid from_account format: {self.from_account}")
 
-        if not self.to_account.startswith("ACC"):
+        if not _ACC_RE.fullmatch(self.to_account):
             raise ValueError(f"Invalid to_account format: {self.to_account}")
 
         if self.amount <= 0:
             raise ValueError(f"Amount must be positive, got: {self.amount}")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TransferResponse:
     """Data model for transfer responses."""
     transaction_id: str
@@ -65,15 +189,186 @@ class TransferResponse:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'TransferResponse':
         """Create TransferResponse from API response."""
+        g = data.get
         return cls(
-            transaction_id=data.get('transactionId', ''),
-            status=data.get('status', 'UNKNOWN'),
-            message=data.get('message', ''),
-            from_account=data.get('fromAccount', ''),
-            to_account=data.get('toAccount', ''),
-            amount=data.get('amount', 0.0),
-            timestamp=data.get('timestamp')
+            transaction_id=g('transactionId', ''),
+            status=g('status', 'UNKNOWN'),
+            message=g('message', ''),
+            from_account=g('fromAccount', ''),
+            to_account=g('toAccount', ''),
+            amount=g('amount', 0.0),
+            timestamp=g('timestamp')
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class TransactionColumns:
+    """Column-oriented transaction history (one list per field)."""
+    # Missing fields are kept as None, so every column lines up by index
+    transaction_ids: List[Optional[str]]
+    from_accounts: List[Optional[str]]
+    to_accounts: List[Optional[str]]
+    amounts: array
+    statuses: List[Optional[str]]
+    timestamps: List[Optional[str]]
+
+    @classmethod
+    def from_transactions(cls, transactions: List[Dict[str, Any]]) -> 'TransactionColumns':
+        """Build columns from the API's list of transaction objects."""
+        return cls(
+            transaction_ids=[t.get('transactionId') for t in transactions],
+            from_accounts=[t.get('fromAccount') for t in transactions],
+            to_accounts=[t.get('toAccount') for t in transactions],
+            amounts=array('d', [t.get('amount') or 0.0 for t in transactions]),
+            statuses=[t.get('status') for t in transactions],
+            timestamps=[t.get('timestamp') for t in transactions]
+        )
+
+    def __len__(self) -> int:
+        return len(self.transaction_ids)
+
+    @property
+    def total_amount(self) -> float:
+        """Sum of all transaction amounts."""
+        return math.fsum(self.amounts)
+
+
+@functools.cache
+def _ssl_context(ca_bundle: str) -> ssl.SSLContext:
+    """Build the process-wide SSL context trusting a default CA bundle file or directory."""
+    if os.path.isdir(ca_bundle):
+        return ssl.create_default_context(capath=ca_bundle)
+    return ssl.create_default_context(cafile=ca_bundle)
+
+
+def _shared_context_bundle(verify: Union[bool, str, None],
+                           cert: Union[str, Tuple[str, str], None]) -> Optional[str]:
+    """
+    Return the CA bundle a request verifies against, if it can use a shared SSL context.
+
+    Args:
+        verify: The request's verify setting
+        cert: The request's client certificate, if any
+
+    Returns:
+        The default CA bundle path, or None for verify=False, a custom CA
+        bundle or a client certificate
+    """
+    if cert is not None:
+        return None
+    if verify is True:
+        return DEFAULT_CA_BUNDLE_PATH
+    # With REQUESTS_CA_BUNDLE/CURL_CA_BUNDLE set, requests passes that path instead of True
+    if isinstance(verify, str) and verify in (os.environ.get("REQUESTS_CA_BUNDLE"),
+                                              os.environ.get("CURL_CA_BUNDLE"),
+                                              DEFAULT_CA_BUNDLE_PATH):
+        return verify
+    return None
+
+
+class _SharedSSLContextAdapter(HTTPAdapter):
+    """HTTPAdapter whose default-verification pools reuse the process-wide SSL context."""
+
+    def build_connection_pool_key_attributes(
+        self, request: requests.PreparedRequest, verify: Union[bool, str],
+        cert: Union[str, Tuple[str, str], None] = None
+    ) -> Tuple['_HostParams', '_PoolKwargs']:
+        host_params, pool_kwargs = super().build_connection_pool_key_attributes(
+            request, verify, cert
         )
+        # urllib3 applies verify_mode and CA/client-cert files to the context it is
+        # given, so only share it when none of those differ from the defaults;
+        # verify=False, a custom CA bundle or a client cert get their own context
+        ca_bundle = _shared_context_bundle(verify, cert)
+        if ca_bundle is not None:
+            pool_kwargs.pop("ca_certs", None)
+            pool_kwargs.pop("ca_cert_dir", None)
+            pool_kwargs["ssl_context"] = _ssl_context(ca_bundle)
+        return host_params, pool_kwargs
+
+    def cert_verify(self, conn: Any, url: str, verify: Union[bool, str],
+                    cert: Union[str, Tuple[str, str], None]) -> None:
+        super().cert_verify(conn, url, verify, cert)
+        # Left set, ca_certs makes urllib3 reload the bundle into the shared
+        # context on every new connection, which is the cost it exists to avoid
+        ca_bundle = _shared_context_bundle(verify, cert)
+        if (ca_bundle is not None
+                and getattr(conn, "conn_kw", {}).get("ssl_context") is _ssl_context(ca_bundle)):
+            conn.ca_certs = None
+            conn.ca_cert_dir = None
+
+
+def _create_session(config: Optional[BankingConfig] = None) -> requests.Session:
+    """
+    Create a requests session with retry logic and connection pooling.
+
+    When requests-cache is installed, the session also keeps list accounts,
+    validate and balance responses in a short-lived in-memory cache, keyed
+    on the Authorization header.
+
+    Args:
+        config: Retry and pool settings (defaults to the global configuration)
+
+    Returns:
+        Configured requests.Session
+    """
+    config = config or get_config()
+    session: requests.Session
+    if CachedSession is not None:
+        session = CachedSession(
+            backend="memory",
+            # Nothing is cached unless its URL is listed in urls_expire_after
+            expire_after=DO_NOT_CACHE,
+            urls_expire_after={_CACHED_URL_RE: _RESPONSE_CACHE_TTL},
+            allowable_methods=("GET",),
+            # The session is shared by every client, so key entries on the caller's
+            # token; requests-cache drops Authorization from keys unless told otherwise
+            match_headers=["Authorization"],
+            ignored_parameters=[p for p in DEFAULT_IGNORED_PARAMS if p != "Authorization"],
+            cache_control=True
+        )
+    else:
+        session = requests.Session()
+
+    # Configure retry strategy with exponential backoff
+    retry_strategy = Retry(
+        total=config.max_retries,
+        backoff_factor=config.backoff_factor,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["HEAD", "GET", "POST", "PUT", "DELETE", "OPTIONS", "TRACE"]
+    )
+
+    adapter = _SharedSSLContextAdapter(
+        max_retries=retry_strategy,
+        pool_connections=config.pool_connections,
+        pool_maxsize=config.pool_maxsize
+    )
+
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    return session
+
+
+@functools.cache
+def _get_shared_session() -> requests.Session:
+    """
+    Get the process-wide session shared by every BankingClient not given its own.
+
+    Created on first use.
+
+    Returns:
+        Shared requests.Session
+    """
+    return _create_session()
+
+
+def close_shared_session() -> None:
+    """Close the process-wide session and its pooled connections."""
+    if _get_shared_session.cache_info().currsize:
+        _get_shared_session().close()
+        _get_shared_session.cache_clear()
+        logger.info("Shared session closed")
 
 
 class BankingClient:
@@ -82,62 +377,80 @@ class BankingClient:
 
     Features:
     - JWT token management with automatic refresh
-    - Connection pooling and retry logic with exponential backoff
+    - Connection pooling shared across client instances
+    - Retry logic with exponential backoff
     - Comprehensive error handling and logging
     - Type hints and modern Python 3.x syntax
     """
 
-    def __init__(self, base_url: str = "http://localhost:8123", timeout: int = 10):
+    def __init__(self, base_url: str = "http://localhost:8123", timeout: int = 10,
+                 session: Optional[requests.Session] = None):
         """
         Initialize the Banking Client.
 
         Args:
             base_url: Base URL of the banking API
             timeout: Request timeout in seconds
+            session: Session to send requests through (defaults to the shared
+                pooled session); the caller stays responsible for closing it
         """
-        self.base_url = base_url.rstrip('/')
+        self.base_url = self._normalize_base_url(base_url)
         self.timeout = timeout
+        self._urls = _build_urls(self.base_url)
+        # Balance requests prepared once per (account_id, use_auth), see _prepare_balance_request
+        self._prepared_balance: Dict[Tuple[str, bool],
+                                     Tuple[requests.PreparedRequest, Mapping[str, Any]]] = {}
         self.token: Optional[str] = None
-        self.token_expiry: Optional[datetime] = None
-
-        # Setup session with connection pooling and retry logic
-        self.session = self._create_session()
-
-        logger.info(f"BankingClient initialized with base_url: {self.base_url}")
-
-    def _create_session(self) -> requests.Session:
-        """
-        Create a requests session with retry logic and connection pooling.
-
-        Returns:
-            Configured requests.Session
-        """
-        session = requests.Session()
-
-        # Configure retry strategy with exponential backoff
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "POST", "PUT", "DELETE", "OPTIONS", "TRACE"]
-        )
-
-        adapter = HTTPAdapter(
-            max_retries=retry_strategy,
-            pool_connections=10,
-            pool_maxsize=20
-        )
-
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-
-        return session
+        # time.monotonic() deadline, immune to wall-clock adjustments
+        self.token_expiry: Optional[float] = None
+
+        # Resolved lazily, so a client whose session is replaced never touches the pool
+        self._session: Optional[requests.Session] = None
+        self.session = session
+
+        logger.info("BankingClient initialized with base_url: %s", self.base_url)
+
+    @staticmethod
+    def _normalize_base_url(url: str) -> str:
+        """Strip trailing slashes so endpoint paths can be appended directly."""
+        return url.rstrip('/')
+
+    @property
+    def session(self) -> requests.Session:
+        """Session requests are sent through (the shared pooled session by default)."""
+        if self._session is None:
+            # Reuse the process-wide session so kept-alive connections survive across clients
+            self._session = _get_shared_session()
+        return self._session
+
+    @session.setter
+    def session(self, value: Optional[requests.Session]) -> None:
+        self._session = value
+        # Prepared requests are bound to the session that prepared them
+        self._prepared_balance.clear()
+
+    @property
+    def token(self) -> Optional[str]:
+        """Current JWT token, if authenticated."""
+        return self._token
+
+    @token.setter
+    def token(self, value: Optional[str]) -> None:
+        self._token = value
+        # Format the Authorization value once per token, not once per request
+        self._auth_header_value = _auth_header_value(value)
+        self._headers_auth = _auth_headers(self._auth_header_value)
+        # Prepared requests embed the Authorization header, so drop them with the old token
+        self._prepared_balance.clear()
 
     def authenticate(self, username: str = "alice", password: str = "secret",
                     scope: str = "transfer") -> str:
         """
         Authenticate and get JWT token with specified scope.
 
+        Tokens are cached per (base_url, username, password, scope) for the
+        process lifetime, so repeated calls only hit /authToken once per token.
+
         Args:
             username: Username for authentication
             password: Password for authentication
@@ -148,36 +461,48 @@ class BankingClient:
 
         Raises:
             requests.HTTPError: If authentication fails
+            ValueError: If the response does not contain a token
         """
-        url = f"{self.base_url}/authToken"
+        cache_key = _token_cache_key(self.base_url, username, password, scope)
+        cached = _get_cached_token(cache_key)
+        if cached is not None:
+            self.token, self.token_expiry = cached
+            logger.info("Using cached token for user '%s' with scope '%s'", username, scope)
+            return self.token
+
+        url = self._urls["auth"]
         params = {"claim": scope}
         payload = {"username": username, "password": password}
 
-        logger.info(f"Authenticating user '{username}' with scope '{scope}'")
+        logger.info("Authenticating user '%s' with scope '%s'", username, scope)
 
         try:
             response = self.session.post(
                 url,
-                json=payload,
+                data=orjson.dumps(payload),
+                headers=self._get_headers(),
                 params=params,
                 timeout=self.timeout
             )
             response.raise_for_status()
 
-            data = response.json()
-            self.token = data.get('token')
+            data = _parse(response)
+            token: Optional[str] = data.get('token')
+            if not token:
+                raise ValueError("Authentication response did not include a token")
 
-            # Set token expiry (assuming 1 hour validity)
-            self.token_expiry = datetime.now() + timedelta(hours=1)
+            self.token = token
+            self.token_expiry = _token_expiry(token)
+            _cache_token(cache_key, token, self.token_expiry)
 
             logger.info("Authentication successful")
-            return self.token
+            return token
 
         except requests.HTTPError as e:
-            logger.error(f"Authentication failed: {e}")
+            logger.error("Authentication failed: %s", e)
             raise
         except Exception as e:
-            logger.error(f"Unexpected error during authentication: {e}")
+            logger.error("Unexpected error during authentication: %s", e)
             raise
 
     def _ensure_authenticated(self, scope: str = "transfer") -> None:
@@ -187,26 +512,25 @@ class BankingClient:
         Args:
             scope: Required token scope
         """
-        if not self.token or (self.token_expiry and datetime.now() >= self.token_expiry):
+        if not self.token or (self.token_expiry is not None
+                              and time.monotonic() >= self.token_expiry):
             logger.info("Token expired or missing, re-authenticating")
             self.authenticate(scope=scope)
 
-    def _get_headers(self, use_auth: bool = False) -> Dict[str, str]:
+    def _get_headers(self, use_auth: bool = False) -> Mapping[str, str]:
         """
         Get request headers, optionally with authentication.
 
+        The mappings are prebuilt and read-only; the authenticated one is
+        rebuilt only when the token changes.
+
         Args:
             use_auth: Whether to include Authorization header
 
         Returns:
-            Dictionary of headers
+            Read-only mapping of headers
         """
-        headers = {"Content-Type": "application/json"}
-
-        if use_auth and self.token:
-            headers["Authorization"] = f"Bearer {self.token}"
-
-        return headers
+        return self._headers_auth if use_auth else _BASE_HEADERS
 
     def transfer(self, from_account: str, to_account: str, amount: float,
                 use_auth: bool = True) -> TransferResponse:
@@ -234,31 +558,36 @@ class BankingClient:
         if use_auth:
             self._ensure_authenticated(scope="transfer")
 
-        url = f"{self.base_url}/transfer"
+        url = self._urls["transfer"]
 
-        logger.info(f"Initiating transfer: {from_account} -> {to_account}, amount: {amount}")
+        logger.info("Initiating transfer: %s -> %s, amount: %s", from_account, to_account, amount)
 
         try:
             response = self.session.post(
                 url,
-                json=transfer_req.to_dict(),
+                data=orjson.dumps(transfer_req.to_dict()),
                 headers=self._get_headers(use_auth=use_auth),
                 timeout=self.timeout
             )
             response.raise_for_status()
 
-            data = response.json()
+            data = _parse(response)
             transfer_resp = TransferResponse.from_dict(data)
 
-            logger.info(f"Transfer successful: {transfer_resp.transaction_id}")
+            # Cached balances and account listings are stale after a transfer
+            if CachedSession is not None and isinstance(self.session, CachedSession):
+                self.session.cache.clear()
+
+            logger.info("Transfer successful: %s", transfer_resp.transaction_id)
             return transfer_resp
 
         except requests.HTTPError as e:
-            logger.error(f"Transfer failed with HTTP error: {e}")
-            logger.error(f"Response: {e.response.text if e.response else 'No response'}")
+            logger.error("Transfer failed with HTTP error: %s", e)
+            logger.error("Response: %s",
+                         e.response.text if e.response is not None else 'No response')
             raise
         except Exception as e:
-            logger.error(f"Unexpected error during transfer: {e}")
+            logger.error("Unexpected error during transfer: %s", e)
             raise
 
     def validate_account(self, account_id: str) -> Dict[str, Any]:
@@ -271,20 +600,20 @@ class BankingClient:
         Returns:
             Account validation response
         """
-        url = f"{self.base_url}/accounts/validate/{account_id}"
+        url = self._urls["validate"] + account_id
 
-        logger.info(f"Validating account: {account_id}")
+        logger.info("Validating account: %s", account_id)
 
         try:
-            response = self.session.get(url, timeout=self.timeout)
+            response = self.session.get(url, headers=self._get_headers(), timeout=self.timeout)
             response.raise_for_status()
 
-            data = response.json()
-            logger.info(f"Account {account_id} validation result: {data.get('isValid')}")
+            data = _parse(response)
+            logger.info("Account %s validation result: %s", account_id, data.get('isValid'))
             return data
 
         except requests.HTTPError as e:
-            logger.error(f"Account validation failed: {e}")
+            logger.error("Account validation failed: %s", e)
             raise
 
     def get_balance(self, account_id: str, use_auth: bool = False) -> Dict[str, Any]:
@@ -301,26 +630,52 @@ class BankingClient:
         if use_auth:
             self._ensure_authenticated(scope="enquiry")
 
-        url = f"{self.base_url}/accounts/balance/{account_id}"
-
-        logger.info(f"Getting balance for account: {account_id}")
+        logger.info("Getting balance for account: %s", account_id)
 
         try:
-            response = self.session.get(
-                url,
-                headers=self._get_headers(use_auth=use_auth),
-                timeout=self.timeout
-            )
+            prepared, send_kwargs = self._prepare_balance_request(account_id, use_auth)
+            response = self.session.send(prepared, timeout=self.timeout, **send_kwargs)
             response.raise_for_status()
 
-            data = response.json()
-            logger.info(f"Balance for {account_id}: {data.get('balance')}")
+            data = _parse(response)
+            logger.info("Balance for %s: %s", account_id, data.get('balance'))
             return data
 
         except requests.HTTPError as e:
-            logger.error(f"Get balance failed: {e}")
+            logger.error("Get balance failed: %s", e)
             raise
 
+    def _prepare_balance_request(self, account_id: str, use_auth: bool
+                                 ) -> Tuple[requests.PreparedRequest, Mapping[str, Any]]:
+        """
+        Get the prepared balance request for an account, building it once.
+
+        Sending a cached PreparedRequest skips the per-call request
+        preparation, header merging and environment lookups of session.get().
+
+        Args:
+            account_id: Account ID
+            use_auth: Whether to include the Authorization header
+
+        Returns:
+            Prepared request and the send() settings resolved for its URL
+        """
+        key = (account_id, use_auth)
+        cached = self._prepared_balance.get(key)
+        if cached is None:
+            request = requests.Request(
+                "GET",
+                self._urls["balance"] + account_id,
+                headers=self._get_headers(use_auth=use_auth)
+            )
+            prepared = self.session.prepare_request(request)
+            send_kwargs = self.session.merge_environment_settings(
+                prepared.url, {}, None, None, None
+            )
+            cached = self._prepared_balance[key] = (prepared, send_kwargs)
+
+        return cached
+
     def list_accounts(self, use_auth: bool = False) -> Dict[str, Any]:
         """
         List all accounts.
@@ -334,7 +689,7 @@ class BankingClient:
         if use_auth:
             self._ensure_authenticated(scope="enquiry")
 
-        url = f"{self.base_url}/accounts"
+        url = self._urls["accounts"]
 
         logger.info("Listing all accounts")
 
@@ -346,10 +701,10 @@ class BankingClient:
             )
             response.raise_for_status()
 
-            return response.json()
+            return _parse(response)
 
         except requests.HTTPError as e:
-            logger.error(f"List accounts failed: {e}")
+            logger.error("List accounts failed: %s", e)
             raise
 
     def get_transaction_history(self) -> Dict[str, Any]:
@@ -361,7 +716,7 @@ class BankingClient:
         """
         self._ensure_authenticated(scope="transfer")
 
-        url = f"{self.base_url}/transactions/history"
+        url = self._urls["history"]
 
         logger.info("Getting transaction history")
 
@@ -373,17 +728,30 @@ class BankingClient:
             )
             response.raise_for_status()
 
-            return response.json()
+            return _parse(response)
 
         except requests.HTTPError as e:
-            logger.error(f"Get transaction history failed: {e}")
+            logger.error("Get transaction history failed: %s", e)
             raise
 
+    def get_transaction_history_columns(self) -> TransactionColumns:
+        """
+        Get transaction history as columns (requires authentication).
+
+        Returns:
+            TransactionColumns with one entry per transaction
+        """
+        history = self.get_transaction_history()
+        return TransactionColumns.from_transactions(history.get('transactions', []))
+
     def close(self) -> None:
-        """Close the session and cleanup resources."""
-        if self.session:
-            self.session.close()
-            logger.info("BankingClient session closed")
+        """
+        Release the client.
+
+        The session is not closed: it is either the shared session, kept open
+        for later clients (see close_shared_session), or owned by the caller.
+        """
+        logger.info("BankingClient closed")
 
     def __enter__(self):
         """Context manager entry."""
@@ -396,6 +764,11 @@ class BankingClient:
 
 def main():
     """Example usage of the Banking Client."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
     # Using context manager for automatic cleanup
     with BankingClient() as client:
         try:
@@ -445,14 +818,16 @@ def main():
             print(f"Total accounts: {len(accounts.get('accounts', []))}")
 
         except ValueError as e:
-            logger.error(f"Validation error: {e}")
+            logger.error("Validation error: %s", e)
             print(f"❌ Error: {e}")
         except requests.HTTPError as e:
-            logger.error(f"API error: {e}")
+            logger.error("API error: %s", e)
             print(f"❌ API Error: {e}")
         except Exception as e:
-            logger.error(f"Unexpected error: {e}")
+            logger.error("Unexpected error: %s", e)
             print(f"❌ Unexpected error: {e}")
+        finally:
+            close_shared_session()
 
 
 if __name__ == "__main__":
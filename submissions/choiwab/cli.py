@@ -5,13 +5,18 @@ Provides interactive command-line access to banking operations.
 """
 
 import argparse
+import logging
 import sys
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 import json
 
-from banking_client import BankingClient
 from config import BankingConfig
 
+# The client (and requests/aiohttp) is imported lazily in main() so that
+# '--help' and argument errors don't pay for it
+if TYPE_CHECKING:
+    from banking_client import BankingClient
+
 
 def setup_parser() -> argparse.ArgumentParser:
     """
@@ -34,12 +39,18 @@ Examples:
   # Validate account
   python cli.py validate --account ACC1000
 
+  # Validate several accounts at once
+  python cli.py validate --account ACC1000 ACC1001 ACC2000
+
   # Get balance
   python cli.py balance --account ACC1000
 
   # List all accounts
   python cli.py list-accounts
 
+  # List all accounts with their balances
+  python cli.py list-accounts --with-balances
+
   # Get transaction history
   python cli.py history
         """
@@ -58,6 +69,12 @@ Examples:
         help="Request timeout in seconds (default: 10)"
     )
 
+    parser.add_argument(
+        "--verbose", "-v",
+        action="store_true",
+        help="Show client log messages"
+    )
+
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
     # Transfer command
@@ -76,9 +93,9 @@ Examples:
                                  help="Password for authentication (default: secret)")
 
     # Validate command
-    validate_parser = subparsers.add_parser("validate", help="Validate account")
-    validate_parser.add_argument("--account", required=True,
-                                help="Account ID to validate")
+    validate_parser = subparsers.add_parser("validate", help="Validate accounts")
+    validate_parser.add_argument("--account", required=True, nargs="+",
+                                help="Account ID(s) to validate")
 
     # Balance command
     balance_parser = subparsers.add_parser("balance", help="Get account balance")
@@ -91,6 +108,8 @@ Examples:
     list_parser = subparsers.add_parser("list-accounts", help="List all accounts")
     list_parser.add_argument("--auth", action="store_true",
                             help="Use JWT authentication")
+    list_parser.add_argument("--with-balances", action="store_true",
+                            help="Fetch every account's balance concurrently")
 
     # History command
     history_parser = subparsers.add_parser("history", help="Get transaction history")
@@ -111,7 +130,7 @@ Examples:
     return parser
 
 
-def handle_transfer(client: BankingClient, args: argparse.Namespace) -> int:
+def handle_transfer(client: 'BankingClient', args: argparse.Namespace) -> int:
     """Handle transfer command."""
     try:
         if args.auth:
@@ -142,21 +161,34 @@ def handle_transfer(client: BankingClient, args: argparse.Namespace) -> int:
         return 1
 
 
-def handle_validate(client: BankingClient, args: argparse.Namespace) -> int:
+def print_validation(result: dict) -> None:
+    """Print a single account validation result."""
+    print(f"\n✅ Validation Result:")
+    print(f"   Account ID: {result.get('accountId')}")
+    print(f"   Valid: {result.get('isValid')}")
+    print(f"   Type: {result.get('accountType')}")
+    print(f"   Status: {result.get('status')}")
+
+    if 'bonusPoints' in result:
+        print(f"   💡 Hint: {result.get('bonusPoints')}")
+
+
+def handle_validate(client: 'BankingClient', args: argparse.Namespace) -> int:
     """Handle validate command."""
     try:
-        print(f"🔍 Validating account {args.account}...")
+        if len(args.account) == 1:
+            print(f"🔍 Validating account {args.account[0]}...")
+            print_validation(client.validate_account(args.account[0]))
+            return 0
 
-        result = client.validate_account(args.account)
+        print(f"🔍 Validating accounts {', '.join(args.account)}...")
 
-        print(f"\n✅ Validation Result:")
-        print(f"   Account ID: {result.get('accountId')}")
-        print(f"   Valid: {result.get('isValid')}")
-        print(f"   Type: {result.get('accountType')}")
-        print(f"   Status: {result.get('status')}")
+        from async_banking_client import validate_accounts
+        results = validate_accounts(args.account, base_url=client.base_url,
+                                    timeout=client.timeout)
 
-        if 'bonusPoints' in result:
-            print(f"   💡 Hint: {result.get('bonusPoints')}")
+        for result in results.values():
+            print_validation(result)
 
         return 0
 
@@ -165,7 +197,7 @@ def handle_validate(client: BankingClient, args: argparse.Namespace) -> int:
         return 1
 
 
-def handle_balance(client: BankingClient, args: argparse.Namespace) -> int:
+def handle_balance(client: 'BankingClient', args: argparse.Namespace) -> int:
     """Handle balance command."""
     try:
         print(f"💰 Getting balance for account {args.account}...")
@@ -184,22 +216,32 @@ def handle_balance(client: BankingClient, args: argparse.Namespace) -> int:
         return 1
 
 
-def handle_list_accounts(client: BankingClient, args: argparse.Namespace) -> int:
+def handle_list_accounts(client: 'BankingClient', args: argparse.Namespace) -> int:
     """Handle list-accounts command."""
     try:
         print("📋 Listing all accounts...")
 
-        result = client.list_accounts(use_auth=args.auth)
+        if args.with_balances:
+            from async_banking_client import get_all_balances
+            accounts = get_all_balances(base_url=client.base_url, timeout=client.timeout,
+                                        use_auth=args.auth)
+        else:
+            accounts = client.list_accounts(use_auth=args.auth).get('accounts', [])
 
-        accounts = result.get('accounts', [])
-        print(f"\n✅ Found {len(accounts)} accounts:")
+        # Buffer the listing and emit it with a single write
+        lines = ["", f"✅ Found {len(accounts)} accounts:"]
+        append = lines.append
 
         for i, account in enumerate(accounts, 1):
-            print(f"\n   {i}. {account.get('accountId')}")
-            print(f"      Type: {account.get('accountType')}")
-            print(f"      Status: {account.get('status')}")
+            get = account.get
+            append("")
+            append(f"   {i}. {get('accountId')}")
+            append(f"      Type: {get('accountType')}")
+            append(f"      Status: {get('status')}")
             if 'balance' in account:
-                print(f"      Balance: ${account.get('balance', 0):.2f}")
+                append(f"      Balance: ${get('balance', 0):.2f}")
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
         return 0
 
@@ -208,7 +250,7 @@ def handle_list_accounts(client: BankingClient, args: argparse.Namespace) -> int
         return 1
 
 
-def handle_history(client: BankingClient, args: argparse.Namespace) -> int:
+def handle_history(client: 'BankingClient', args: argparse.Namespace) -> int:
     """Handle history command."""
     try:
         print(f"🔐 Authenticating as {args.username}...")
@@ -216,18 +258,24 @@ def handle_history(client: BankingClient, args: argparse.Namespace) -> int:
 
         print("📜 Getting transaction history...")
 
-        result = client.get_transaction_history()
+        history = client.get_transaction_history_columns()
 
-        transactions = result.get('transactions', [])
-        print(f"\n✅ Found {len(transactions)} transactions:")
+        # Buffer the listing and emit it with a single write
+        lines = ["", f"✅ Found {len(history)} transactions:"]
+        append = lines.append
 
-        for i, tx in enumerate(transactions, 1):
-            print(f"\n   {i}. Transaction ID: {tx.get('transactionId')}")
-            print(f"      From: {tx.get('fromAccount')} → To: {tx.get('toAccount')}")
-            print(f"      Amount: ${tx.get('amount', 0):.2f}")
-            print(f"      Status: {tx.get('status')}")
-            if 'timestamp' in tx:
-                print(f"      Time: {tx.get('timestamp')}")
+        rows = zip(history.transaction_ids, history.from_accounts, history.to_accounts,
+                   history.amounts, history.statuses, history.timestamps)
+        for i, (tx_id, from_acc, to_acc, amount, status, timestamp) in enumerate(rows, 1):
+            append("")
+            append(f"   {i}. Transaction ID: {tx_id}")
+            append(f"      From: {from_acc} → To: {to_acc}")
+            append(f"      Amount: ${amount:.2f}")
+            append(f"      Status: {status}")
+            if timestamp is not None:
+                append(f"      Time: {timestamp}")
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
         return 0
 
@@ -236,7 +284,7 @@ def handle_history(client: BankingClient, args: argparse.Namespace) -> int:
         return 1
 
 
-def handle_auth(client: BankingClient, args: argparse.Namespace) -> int:
+def handle_auth(client: 'BankingClient', args: argparse.Namespace) -> int:
     """Handle auth command."""
     try:
         print(f"🔐 Authenticating as {args.username} with scope '{args.scope}'...")
@@ -267,6 +315,14 @@ def main() -> int:
         parser.print_help()
         return 1
 
+    if args.verbose:
+        logging.basicConfig(
+            level=logging.INFO,
+            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        )
+
+    from banking_client import BankingClient
+
     # Create client with custom URL and timeout
     config = BankingConfig(
         api_base_url=args.url,
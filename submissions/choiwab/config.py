@@ -3,13 +3,14 @@ Configuration management for Banking Client.
 Supports environment-based configuration.
 """
 
+import functools
 import os
 from dataclasses import dataclass
 from typing import Optional
 from pathlib import Path
 
 
-@dataclass
+@dataclass(frozen=True)
 class BankingConfig:
     """Configuration settings for the Banking Client."""
 
@@ -50,16 +51,16 @@ class BankingConfig:
             BankingConfig instance with values from environment
         """
         return cls(
-            api_base_url=os.getenv("BANKING_API_URL", "http://localhost:8123"),
-            api_timeout=int(os.getenv("BANKING_API_TIMEOUT", "10")),
-            default_username=os.getenv("BANKING_USERNAME", "alice"),
-            default_password=os.getenv("BANKING_PASSWORD", "secret"),
-            default_scope=os.getenv("BANKING_SCOPE", "transfer"),
-            max_retries=int(os.getenv("MAX_RETRIES", "3")),
-            backoff_factor=float(os.getenv("BACKOFF_FACTOR", "1.0")),
-            pool_connections=int(os.getenv("POOL_CONNECTIONS", "10")),
-            pool_maxsize=int(os.getenv("POOL_MAXSIZE", "20")),
-            log_level=os.getenv("LOG_LEVEL", "INFO")
+            api_base_url=os.environ.get("BANKING_API_URL", "http://localhost:8123"),
+            api_timeout=int(os.environ.get("BANKING_API_TIMEOUT", "10")),
+            default_username=os.environ.get("BANKING_USERNAME", "alice"),
+            default_password=os.environ.get("BANKING_PASSWORD", "secret"),
+            default_scope=os.environ.get("BANKING_SCOPE", "transfer"),
+            max_retries=int(os.environ.get("MAX_RETRIES", "3")),
+            backoff_factor=float(os.environ.get("BACKOFF_FACTOR", "1.0")),
+            pool_connections=int(os.environ.get("POOL_CONNECTIONS", "10")),
+            pool_maxsize=int(os.environ.get("POOL_MAXSIZE", "20")),
+            log_level=os.environ.get("LOG_LEVEL", "INFO")
         )
 
     @classmethod
@@ -86,8 +87,14 @@ class BankingConfig:
         return cls.from_env()
 
 
-# Singleton instance
-_config: Optional[BankingConfig] = None
+@functools.cache
+def _load() -> BankingConfig:
+    """Load the configuration from the environment once per process."""
+    return BankingConfig.from_env()
+
+
+# Explicit override installed with set_config()
+_config_override: Optional[BankingConfig] = None
 
 
 def get_config() -> BankingConfig:
@@ -95,12 +102,9 @@ def get_config() -> BankingConfig:
     Get the global configuration instance.
 
     Returns:
-        BankingConfig singleton instance
+        The set_config() override if any, otherwise the cached environment config
     """
-    global _config
-    if _config is None:
-        _config = BankingConfig.from_env()
-    return _config
+    return _config_override or _load()
 
 
 def set_config(config: BankingConfig) -> None:
@@ -110,5 +114,5 @@ def set_config(config: BankingConfig) -> None:
     Args:
         config: BankingConfig instance to set as global
     """
-    global _config
-    _config = config
+    global _config_override
+    _config_override = config
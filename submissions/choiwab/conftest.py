@@ -0,0 +1,27 @@
+"""
+Shared pytest configuration.
+Integration tests are only collected when '--integration' is passed.
+"""
+
+from pathlib import Path
+
+INTEGRATION_DIR = Path(__file__).parent / "tests" / "integration"
+
+
+def pytest_addoption(parser):
+    """Register the '--integration' command-line option."""
+    parser.addoption(
+        "--integration",
+        action="store_true",
+        default=False,
+        help="Run integration tests (require a running server)"
+    )
+
+
+def pytest_ignore_collect(collection_path, config):
+    """Skip the integration directory unless '--integration' is passed."""
+    if config.getoption("--integration"):
+        return None
+    if collection_path == INTEGRATION_DIR or INTEGRATION_DIR in collection_path.parents:
+        return True
+    return None
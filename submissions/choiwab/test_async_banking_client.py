@@ -0,0 +1,308 @@
+"""
+Unit tests for Async Banking Client.
+Coroutines are driven with asyncio.run against a mocked aiohttp session.
+"""
+
+import asyncio
+import aiohttp
+import orjson
+import pytest
+from unittest.mock import Mock, MagicMock, AsyncMock, patch
+
+from async_banking_client import AsyncBankingClient, _BULK_VALIDATE_UNSUPPORTED
+from banking_client import _TOKEN_CACHE
+from config import BankingConfig
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    """Isolate tests from tokens cached by earlier tests."""
+    _TOKEN_CACHE.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_bulk_support():
+    """Forget base URLs marked as lacking the bulk validation endpoint."""
+    _BULK_VALIDATE_UNSUPPORTED.clear()
+
+
+# Body of the 500 the bundled server's catch-all handler sends for POST /accounts/validate/bulk
+MISSING_ROUTE_BODY = ('{"status":"FAILED","error":"An unexpected error occurred: '
+                      'Request method \'POST\' is not supported"}')
+
+
+def http_error(status, body=""):
+    """Create the error aiohttp raises for an HTTP error status and body."""
+    return aiohttp.ClientResponseError(request_info=Mock(), history=(), status=status,
+                                       message=body)
+
+
+def make_session(*payloads):
+    """
+    Create a mock aiohttp session returning the given JSON payloads in order.
+
+    A payload that is a ClientResponseError becomes an error response with
+    its status and its message as the body.
+    """
+    responses = []
+    for payload in payloads:
+        response = MagicMock()
+        response.__aenter__.return_value = response
+        if isinstance(payload, aiohttp.ClientResponseError):
+            response.ok = False
+            response.status = payload.status
+            response.read = AsyncMock(return_value=payload.message.encode())
+        else:
+            response.ok = True
+            response.read = AsyncMock(return_value=orjson.dumps(payload))
+        responses.append(response)
+
+    session = Mock()
+    session.request = Mock(side_effect=responses)
+    return session
+
+
+class TestAsyncBankingClient:
+    """Test cases for AsyncBankingClient."""
+
+    @pytest.fixture
+    def client(self):
+        """Create an AsyncBankingClient instance for testing."""
+        return AsyncBankingClient(base_url="http://localhost:8123/", timeout=5)
+
+    def test_client_initialization(self, client):
+        """Test client initialization."""
+        assert client.base_url == "http://localhost:8123"
+        assert client.timeout == 5
+        assert client.token is None
+        assert client.limit_per_host == 20
+
+    def test_limit_per_host_override(self):
+        """Test the per-host connection limit can be raised."""
+        client = AsyncBankingClient(limit_per_host=100)
+        assert client.limit_per_host == 100
+
+    def test_request_outside_context_manager(self, client):
+        """Test that requests require an open session."""
+        with pytest.raises(RuntimeError, match="async with"):
+            asyncio.run(client.validate_account("ACC1000"))
+
+    def test_validate_account_success(self, client):
+        """Test successful account validation."""
+        client._session = make_session({"accountId": "ACC1000", "isValid": True})
+
+        result = asyncio.run(client.validate_account("ACC1000"))
+
+        assert result["isValid"] is True
+        method, url = client._session.request.call_args[0]
+        assert method == "GET"
+        assert url == "http://localhost:8123/accounts/validate/ACC1000"
+
+    def test_authenticate_uses_cached_token(self, client):
+        """Test that a second authenticate call is served from the token cache."""
+        client._session = make_session({"token": "async_token"})
+
+        asyncio.run(client.authenticate(scope="transfer"))
+        token = asyncio.run(client.authenticate(scope="transfer"))
+
+        assert token == "async_token"
+        assert client._session.request.call_count == 1
+
+    def test_transfer_many(self, client):
+        """Test that transfer_many gathers transfers in request order."""
+        client._session = make_session(
+            {"transactionId": "tx1", "status": "SUCCESS", "amount": 10.0},
+            {"transactionId": "tx2", "status": "SUCCESS", "amount": 20.0},
+        )
+
+        results = asyncio.run(client.transfer_many([
+            {"from_account": "ACC1000", "to_account": "ACC1001", "amount": 10.0, "use_auth": False},
+            {"from_account": "ACC1002", "to_account": "ACC1003", "amount": 20.0, "use_auth": False},
+        ]))
+
+        assert [r.transaction_id for r in results] == ["tx1", "tx2"]
+        assert client._session.request.call_count == 2
+
+    def test_transfer_many_authenticates_once(self, client):
+        """Test gathered authenticated transfers share one token request."""
+        client._session = make_session(
+            {"token": "async_token"},
+            *[{"transactionId": f"tx{i}", "status": "SUCCESS"} for i in range(5)],
+        )
+        responses = list(client._session.request.side_effect)
+
+        async def slow_read():
+            # Yield to the event loop so the other transfers run mid-authentication
+            await asyncio.sleep(0)
+            return orjson.dumps({"token": "async_token"})
+
+        responses[0].read = slow_read
+        client._session.request.side_effect = responses
+
+        results = asyncio.run(client.transfer_many([
+            {"from_account": "ACC1000", "to_account": "ACC1001", "amount": 10.0}
+            for _ in range(5)
+        ]))
+
+        assert len(results) == 5
+        urls = [c[0][1] for c in client._session.request.call_args_list]
+        assert urls.count("http://localhost:8123/authToken") == 1
+        assert client._session.request.call_count == 6
+
+    def test_get_all_balances(self, client):
+        """Test balances are fetched for every listed account."""
+        client._session = make_session(
+            {"accounts": [{"accountId": "ACC1000", "status": "ACTIVE"},
+                          {"accountId": "ACC1001", "status": "ACTIVE"}]},
+            {"accountId": "ACC1000", "balance": 100.0},
+            {"accountId": "ACC1001", "balance": 200.0},
+        )
+
+        accounts = asyncio.run(client.get_all_balances())
+
+        assert [a["balance"] for a in accounts] == [100.0, 200.0]
+        assert accounts[0]["status"] == "ACTIVE"
+        urls = [c[0][1] for c in client._session.request.call_args_list]
+        assert urls[1:] == [
+            "http://localhost:8123/accounts/balance/ACC1000",
+            "http://localhost:8123/accounts/balance/ACC1001",
+        ]
+
+    def test_validate_accounts_bulk(self, client):
+        """Test several accounts are validated in one bulk request."""
+        client._session = make_session({"accounts": [
+            {"accountId": "ACC1001", "isValid": True},
+            {"accountId": "ACC1000", "isValid": True},
+        ]})
+
+        results = asyncio.run(client.validate_accounts(["ACC1000", "ACC1001"]))
+
+        assert list(results) == ["ACC1000", "ACC1001"]
+        assert results["ACC1001"]["isValid"] is True
+        method, url = client._session.request.call_args[0]
+        assert (method, url) == ("POST", "http://localhost:8123/accounts/validate/bulk")
+        body = orjson.loads(client._session.request.call_args[1]["data"])
+        assert body == {"accountIds": ["ACC1000", "ACC1001"]}
+
+    @pytest.mark.parametrize("error", [
+        http_error(404), http_error(405), http_error(500, MISSING_ROUTE_BODY)
+    ], ids=["404", "405", "bundled-server-500"])
+    def test_validate_accounts_fallback(self, client, error):
+        """Test validation falls back to single lookups without a bulk endpoint."""
+        client._session = make_session(
+            error,
+            {"accountId": "ACC1000", "isValid": True},
+            {"accountId": "ACC2000", "isValid": False},
+        )
+
+        results = asyncio.run(client.validate_accounts(["ACC1000", "ACC2000"]))
+
+        assert results["ACC1000"]["isValid"] is True
+        assert results["ACC2000"]["isValid"] is False
+        # The bulk probe is not retried
+        assert client._session.request.call_count == 3
+        assert client.base_url in _BULK_VALIDATE_UNSUPPORTED
+
+    @pytest.mark.parametrize("error", [
+        http_error(500, '{"status":"FAILED","error":"An unexpected error occurred: boom"}'),
+        http_error(502), http_error(503), http_error(504)
+    ], ids=["500", "502", "503", "504"])
+    def test_validate_accounts_transient_bulk_error(self, client, error):
+        """Test other server errors fall back once without disabling the bulk endpoint."""
+        client._session = make_session(
+            error,
+            {"accountId": "ACC1000", "isValid": True},
+        )
+
+        results = asyncio.run(client.validate_accounts(["ACC1000"]))
+
+        assert results["ACC1000"]["isValid"] is True
+        assert client._session.request.call_count == 2
+        assert client.base_url not in _BULK_VALIDATE_UNSUPPORTED
+
+    def test_validate_accounts_bulk_reply_missing_ids(self, client):
+        """Test IDs left out of the bulk reply are validated individually."""
+        client._session = make_session(
+            {"accounts": [{"accountId": "ACC1000", "isValid": True}]},
+            {"accountId": "ACC2000", "isValid": False},
+        )
+
+        results = asyncio.run(client.validate_accounts(["ACC1000", "ACC2000"]))
+
+        assert results == {
+            "ACC1000": {"accountId": "ACC1000", "isValid": True},
+            "ACC2000": {"accountId": "ACC2000", "isValid": False},
+        }
+        method, url = client._session.request.call_args[0]
+        assert (method, url) == ("GET", "http://localhost:8123/accounts/validate/ACC2000")
+
+    def test_validate_accounts_skips_known_unsupported_bulk(self, client):
+        """Test a base URL known to lack the bulk endpoint is not probed again."""
+        _BULK_VALIDATE_UNSUPPORTED.add(client.base_url)
+        client._session = make_session({"accountId": "ACC1000", "isValid": True})
+
+        results = asyncio.run(client.validate_accounts(["ACC1000"]))
+
+        assert results["ACC1000"]["isValid"] is True
+        method, url = client._session.request.call_args[0]
+        assert (method, url) == ("GET", "http://localhost:8123/accounts/validate/ACC1000")
+
+    def test_validate_accounts_bulk_error(self, client):
+        """Test other bulk validation errors are raised."""
+        client._session = make_session(http_error(400))
+
+        with pytest.raises(aiohttp.ClientResponseError):
+            asyncio.run(client.validate_accounts(["ACC1000"]))
+
+    def test_request_retries_transient_errors(self, client):
+        """Test transient errors are retried with a non-blocking jittered sleep."""
+        client._session = make_session(http_error(503), http_error(429), {"accounts": []})
+
+        with patch("async_banking_client.asyncio.sleep", new=AsyncMock()) as sleep, \
+                patch("async_banking_client.random.uniform", return_value=0.5) as uniform:
+            result = asyncio.run(client.list_accounts())
+
+        assert result == {"accounts": []}
+        assert client._session.request.call_count == 3
+        assert [c.args for c in uniform.call_args_list] == [(0, 1.0), (0, 2.0)]
+        assert sleep.await_count == 2
+
+    def test_request_gives_up_after_max_retries(self, client):
+        """Test the last transient error is raised once retries are exhausted."""
+        client._session = make_session(*[http_error(500)] * 4)
+
+        with patch("async_banking_client.asyncio.sleep", new=AsyncMock()):
+            with pytest.raises(aiohttp.ClientResponseError):
+                asyncio.run(client.list_accounts())
+
+        assert client._session.request.call_count == 4
+
+    def test_request_negative_max_retries(self, client):
+        """Test a negative retry setting still makes exactly one attempt."""
+        client._session = make_session(http_error(503))
+
+        with patch("async_banking_client.get_config",
+                   return_value=BankingConfig(max_retries=-1)):
+            with pytest.raises(aiohttp.ClientResponseError):
+                asyncio.run(client.list_accounts())
+
+        assert client._session.request.call_count == 1
+
+    def test_transfer_invalid_amount(self, client):
+        """Test transfer validation runs before any request."""
+        client._session = make_session()
+
+        with pytest.raises(ValueError, match="Amount must be positive"):
+            asyncio.run(client.transfer("ACC1000", "ACC1001", -1.0, use_auth=False))
+
+        client._session.request.assert_not_called()
+
+    def test_context_manager(self):
+        """Test the session is opened and closed by the async context manager."""
+        async def run():
+            async with AsyncBankingClient() as client:
+                assert client._session is not None
+            return client
+
+        client = asyncio.run(run())
+        assert client._session is None
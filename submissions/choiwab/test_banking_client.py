@@ -3,70 +3,203 @@ Unit tests for Banking Client.
 Demonstrates modern Python testing with pytest.
 """
 
+import base64
+import json
+import shutil
+import ssl
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import orjson
 import pytest
-from unittest.mock import Mock, patch, MagicMock
-from datetime import datetime, timedelta
+from unittest.mock import Mock, patch
+import time
 import requests
+import requests_mock
+from cachetools import TTLCache
+from requests import Session
+from requests.utils import DEFAULT_CA_BUNDLE_PATH
 
+import banking_client
 from banking_client import (
     BankingClient,
     TransferRequest,
-    TransferResponse
+    TransferResponse,
+    close_shared_session,
+    _get_shared_session,
+    _create_session,
+    _cache_token,
+    _get_cached_token,
+    _ssl_context,
+    _token_cache_key,
+    _TOKEN_CACHE
 )
+from config import BankingConfig
+
+
+# Token expiry offsets in seconds, relative to the monotonic clock
+_FUTURE_DELTA = 3600.0
+_PAST_DELTA = -3600.0
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    """Isolate tests from tokens cached by earlier tests."""
+    _TOKEN_CACHE.clear()
+
+
+@pytest.fixture
+def shared_session(mocker):
+    """Back the shared session with mocks so it does not depend on optional packages."""
+    _get_shared_session.cache_clear()
+    mocker.patch('banking_client._create_session', side_effect=lambda: Mock(spec=Session))
+    yield
+    # Keep the mock out of later tests and other modules
+    _get_shared_session.cache_clear()
+
+
+@pytest.fixture(scope="session")
+def make_response():
+    """Return a factory for mock responses carrying a JSON payload."""
+    def _make(payload, status=200):
+        response = Mock()
+        response.content = orjson.dumps(payload)
+        response.raise_for_status = Mock()
+        response.status_code = status
+        return response
+    return _make
+
+
+@pytest.fixture(scope="session")
+def fixed_times():
+    """Return token expiry deadlines around a fixed monotonic 'now'."""
+    now = 1_000_000.0
+    return {"now": now, "past": now + _PAST_DELTA, "future": now + _FUTURE_DELTA}
+
+
+@pytest.fixture
+def frozen_clock(fixed_times):
+    """Freeze the client's monotonic clock at fixed_times['now']."""
+    # Swap the module's time reference so the real time.monotonic stays untouched
+    clock = Mock(wraps=time, monotonic=Mock(return_value=fixed_times["now"]))
+    with patch.object(banking_client, "time", clock):
+        yield fixed_times
+
+
+# Canned API responses served by the requests-mock transport adapter
+API_ROUTES = [
+    ("POST", "http://localhost:8123/authToken", {"token": "test_token_123"}),
+    ("POST", "http://localhost:8123/transfer",
+     {"transactionId": "tx123", "status": "SUCCESS", "message": "Transfer completed",
+      "fromAccount": "ACC1000", "toAccount": "ACC1001", "amount": 100.0}),
+    ("GET", "http://localhost:8123/accounts/validate/ACC1000",
+     {"accountId": "ACC1000", "isValid": True, "accountType": "VALID_ACCOUNT",
+      "status": "ACTIVE"}),
+    ("GET", "http://localhost:8123/accounts/balance/ACC1000",
+     {"accountId": "ACC1000", "balance": 1000.0, "currency": "USD"}),
+    ("GET", "http://localhost:8123/accounts",
+     {"accounts": [{"accountId": "ACC1000", "status": "ACTIVE"},
+                   {"accountId": "ACC1001", "status": "ACTIVE"}]}),
+]
+
+
+@pytest.fixture(scope="module")
+def api_adapter():
+    """Create a requests-mock transport adapter with the API routes registered once."""
+    adapter = requests_mock.Adapter()
+    for method, url, payload in API_ROUTES:
+        adapter.register_uri(method, url, json=payload)
+    return adapter
+
+
+class _OkHandler(BaseHTTPRequestHandler):
+    """Answer every GET with an empty JSON object."""
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def tls_server(tmp_path_factory):
+    """Serve HTTPS on a free local port with a self-signed certificate; yields (url, ca_path)."""
+    if shutil.which("openssl") is None:
+        pytest.skip("openssl is required to create a test certificate")
+    tmp = tmp_path_factory.mktemp("tls")
+    cert, key = tmp / "cert.pem", tmp / "key.pem"
+    subprocess.run(
+        ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+         "-keyout", str(key), "-out", str(cert), "-subj", "/CN=localhost",
+         "-addext", "subjectAltName=DNS:localhost,IP:127.0.0.1"],
+        check=True, capture_output=True
+    )
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _OkHandler)
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert, key)
+    server.socket = context.wrap_socket(server.socket, server_side=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"https://127.0.0.1:{server.server_port}/", str(cert)
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(scope="module")
+def client():
+    """Create one BankingClient shared by the tests in this module."""
+    return BankingClient(base_url="http://localhost:8123", timeout=5,
+                         session=Session())
+
+
+@pytest.fixture(scope="session")
+def valid_request():
+    """Create one valid (immutable) transfer request shared by read-only tests."""
+    return TransferRequest(from_account="ACC1000", to_account="ACC1001", amount=100.0)
 
 
 class TestTransferRequest:
     """Test cases for TransferRequest data model."""
 
-    def test_transfer_request_creation(self):
+    def test_transfer_request_creation(self, valid_request):
         """Test creating a transfer request."""
-        req = TransferRequest(
-            from_account="ACC1000",
-            to_account="ACC1001",
-            amount=100.0
-        )
-
-        assert req.from_account == "ACC1000"
-        assert req.to_account == "ACC1001"
-        assert req.amount == 100.0
+        assert valid_request.from_account == "ACC1000"
+        assert valid_request.to_account == "ACC1001"
+        assert valid_request.amount == 100.0
 
-    def test_transfer_request_to_dict(self):
+    def test_transfer_request_to_dict(self, valid_request):
         """Test converting transfer request to dictionary."""
-        req = TransferRequest("ACC1000", "ACC1001", 100.0)
-        data = req.to_dict()
+        data = valid_request.to_dict()
 
         assert data["fromAccount"] == "ACC1000"
         assert data["toAccount"] == "ACC1001"
         assert data["amount"] == 100.0
 
-    def test_validate_valid_request(self):
+    def test_validate_valid_request(self, valid_request):
         """Test validation of valid transfer request."""
-        req = TransferRequest("ACC1000", "ACC1001", 100.0)
         # Should not raise exception
-        req.validate()
-
-    def test_validate_missing_accounts(self):
-        """Test validation fails for missing accounts."""
-        req = TransferRequest("", "ACC1001", 100.0)
-        with pytest.raises(ValueError, match="Both from_account and to_account are required"):
-            req.validate()
-
-    def test_validate_invalid_account_format(self):
-        """Test validation fails for invalid account format."""
-        req = TransferRequest("INVALID", "ACC1001", 100.0)
-        with pytest.raises(ValueError, match="Invalid from_account format"):
-            req.validate()
-
-    def test_validate_negative_amount(self):
-        """Test validation fails for negative amount."""
-        req = TransferRequest("ACC1000", "ACC1001", -100.0)
-        with pytest.raises(ValueError, match="Amount must be positive"):
-            req.validate()
-
-    def test_validate_zero_amount(self):
-        """Test validation fails for zero amount."""
-        req = TransferRequest("ACC1000", "ACC1001", 0.0)
-        with pytest.raises(ValueError, match="Amount must be positive"):
+        valid_request.validate()
+
+    @pytest.mark.parametrize("from_acc,to_acc,amount,err", [
+        ("", "ACC1001", 100.0, "Both from_account and to_account are required"),
+        ("INVALID", "ACC1001", 100.0, "Invalid from_account format"),
+        ("ACC1000", "ACC10x1", 100.0, "Invalid to_account format"),
+        ("ACC\u0661\u0662\u0663", "ACC1001", 100.0, "Invalid from_account format"),
+        ("ACC1000", "ACC1001", -100.0, "Amount must be positive"),
+        ("ACC1000", "ACC1001", 0.0, "Amount must be positive"),
+    ], ids=["missing_account", "invalid_format", "invalid_suffix", "non_ascii_digits",
+            "negative_amount", "zero_amount"])
+    def test_validate_invalid_request(self, from_acc, to_acc, amount, err):
+        """Test validation fails for invalid transfer requests."""
+        req = TransferRequest(from_acc, to_acc, amount)
+        with pytest.raises(ValueError, match=err):
             req.validate()
 
 
@@ -88,49 +221,55 @@ class TestTransferResponse:
         assert resp.status == "SUCCESS"
         assert resp.amount == 100.0
 
-    def test_from_dict(self):
-        """Test creating TransferResponse from dictionary."""
-        data = {
-            "transactionId": "tx123",
-            "status": "SUCCESS",
-            "message": "Transfer completed",
-            "fromAccount": "ACC1000",
-            "toAccount": "ACC1001",
-            "amount": 100.0,
-            "timestamp": "2024-01-01T12:00:00"
-        }
-
-        resp = TransferResponse.from_dict(data)
+    def test_transfer_response_is_immutable(self):
+        """Test that TransferResponse is frozen and has no instance __dict__."""
+        resp = TransferResponse.from_dict({"transactionId": "tx123"})
 
-        assert resp.transaction_id == "tx123"
-        assert resp.status == "SUCCESS"
-        assert resp.from_account == "ACC1000"
-        assert resp.to_account == "ACC1001"
-        assert resp.amount == 100.0
-        assert resp.timestamp == "2024-01-01T12:00:00"
+        assert not hasattr(resp, "__dict__")
+        with pytest.raises(AttributeError):
+            resp.status = "FAILED"
 
-    def test_from_dict_missing_fields(self):
-        """Test from_dict handles missing fields gracefully."""
-        data = {}
-        resp = TransferResponse.from_dict(data)
+    @pytest.mark.parametrize("payload,expected", [
+        ({"transactionId": "tx123", "status": "SUCCESS", "message": "Transfer completed",
+          "fromAccount": "ACC1000", "toAccount": "ACC1001", "amount": 100.0,
+          "timestamp": "2024-01-01T12:00:00"},
+         {"transaction_id": "tx123", "status": "SUCCESS", "message": "Transfer completed",
+          "from_account": "ACC1000", "to_account": "ACC1001", "amount": 100.0,
+          "timestamp": "2024-01-01T12:00:00"}),
+        ({}, {"transaction_id": "", "status": "UNKNOWN", "amount": 0.0}),
+    ], ids=["all_fields", "missing_fields"])
+    def test_from_dict(self, payload, expected):
+        """Test creating TransferResponse from dictionary, with defaults for missing fields."""
+        resp = TransferResponse.from_dict(payload)
 
-        assert resp.transaction_id == ""
-        assert resp.status == "UNKNOWN"
-        assert resp.amount == 0.0
+        for field, value in expected.items():
+            assert getattr(resp, field) == value
 
 
 class TestBankingClient:
     """Test cases for BankingClient."""
 
+    @pytest.fixture(autouse=True)
+    def _reset_client(self, client):
+        """Give each test a logged-out client with a fresh mock session."""
+        client.token = None
+        client.token_expiry = None
+        client.session = Mock(spec=Session)
+        # Unlike MagicMock, a plain Mock can't be unpacked with ** in get_balance
+        client.session.merge_environment_settings.return_value = {}
+
     @pytest.fixture
-    def client(self):
-        """Create a BankingClient instance for testing."""
-        return BankingClient(base_url="http://localhost:8123", timeout=5)
+    def mocked_api(self, client, api_adapter):
+        """Send the client's requests through the requests-mock adapter."""
+        api_adapter.reset()
+        client.session = Session()
+        client.session.mount("http://", api_adapter)
+        return api_adapter
 
     @pytest.fixture
     def mock_session(self):
         """Create a mock session for testing."""
-        return MagicMock()
+        return Mock(spec=Session)
 
     def test_client_initialization(self, client):
         """Test client initialization."""
@@ -139,20 +278,17 @@ class TestBankingClient:
         assert client.token is None
         assert client.token_expiry is None
 
-    def test_base_url_trailing_slash_removed(self):
-        """Test that trailing slash is removed from base URL."""
-        client = BankingClient(base_url="http://localhost:8123/")
-        assert client.base_url == "http://localhost:8123"
+    @pytest.mark.parametrize("url,expected", [
+        ("http://localhost:8123/", "http://localhost:8123"),
+        ("http://localhost:8123", "http://localhost:8123"),
+        ("http://localhost:8123///", "http://localhost:8123"),
+    ])
+    def test_normalize_base_url(self, url, expected):
+        """Test that trailing slashes are removed from the base URL."""
+        assert BankingClient._normalize_base_url(url) == expected
 
-    @patch('banking_client.requests.Session')
-    def test_authenticate_success(self, mock_session_class, client):
+    def test_authenticate_success(self, client, mocked_api):
         """Test successful authentication."""
-        mock_response = Mock()
-        mock_response.json.return_value = {"token": "test_token_123"}
-        mock_response.raise_for_status = Mock()
-
-        client.session.post = Mock(return_value=mock_response)
-
         token = client.authenticate(username="alice", password="secret", scope="transfer")
 
         assert token == "test_token_123"
@@ -160,13 +296,60 @@ class TestBankingClient:
         assert client.token_expiry is not None
 
         # Verify the call
-        client.session.post.assert_called_once()
-        call_args = client.session.post.call_args
-        assert "authToken" in call_args[0][0]
-        assert call_args[1]["params"] == {"claim": "transfer"}
+        assert mocked_api.call_count == 1
+        assert mocked_api.last_request.url == "http://localhost:8123/authToken?claim=transfer"
+
+    def test_authenticate_uses_cached_token(self, client, make_response):
+        """Test that a second client reuses the cached token without a request."""
+        mock_response = make_response({"token": "cached_token"})
+
+        client.session.post = Mock(return_value=mock_response)
+        client.authenticate(username="alice", password="secret", scope="transfer")
+
+        other = BankingClient(base_url="http://localhost:8123", timeout=5,
+                              session=Session())
+        other.session.post = Mock()
+
+        token = other.authenticate(username="alice", password="secret", scope="transfer")
+
+        assert token == "cached_token"
+        assert other.token_expiry == client.token_expiry
+        other.session.post.assert_not_called()
+
+    def test_token_cache_thread_safe(self):
+        """Test concurrent reads, writes and evictions of the token cache never raise."""
+        # A tiny, fast-expiring cache makes get() and set evict constantly
+        cache = TTLCache(maxsize=4, ttl=0.0005)
+        keys = [_token_cache_key("http://localhost:8123", f"user{i}", "secret", "transfer")
+                for i in range(16)]
+        expiry = time.monotonic() + _FUTURE_DELTA
+
+        def hammer(offset):
+            for i in range(2000):
+                key = keys[(offset + i) % len(keys)]
+                _cache_token(key, "token", expiry)
+                _get_cached_token(key)
+
+        with patch.object(banking_client, "_TOKEN_CACHE", cache), \
+                ThreadPoolExecutor(max_workers=8) as pool:
+            # result() re-raises any KeyError from a worker thread
+            for future in [pool.submit(hammer, n) for n in range(8)]:
+                future.result()
+
+    def test_authenticate_reads_jwt_expiry(self, client, make_response):
+        """Test that token expiry comes from the JWT 'exp' claim."""
+        exp = int(time.time()) + 600
+        claims = base64.urlsafe_b64encode(json.dumps({"exp": exp}).encode()).decode().rstrip("=")
+        token = f"header.{claims}.signature"
+
+        mock_response = make_response({"token": token})
+        client.session.post = Mock(return_value=mock_response)
+
+        client.authenticate(username="alice", password="secret", scope="enquiry")
+
+        assert client.token_expiry == pytest.approx(time.monotonic() + 600, abs=5)
 
-    @patch('banking_client.requests.Session')
-    def test_authenticate_http_error(self, mock_session_class, client):
+    def test_authenticate_http_error(self, client):
         """Test authentication with HTTP error."""
         mock_response = Mock()
         mock_response.raise_for_status.side_effect = requests.HTTPError("401 Unauthorized")
@@ -176,11 +359,21 @@ class TestBankingClient:
         with pytest.raises(requests.HTTPError):
             client.authenticate(username="invalid", password="invalid")
 
+    def test_authenticate_missing_token(self, client, make_response):
+        """Test authentication fails when the response carries no token."""
+        client.session.post = Mock(return_value=make_response({}))
+
+        with pytest.raises(ValueError):
+            client.authenticate(username="alice", password="secret", scope="enquiry")
+
+        assert client.token is None
+
     def test_get_headers_no_auth(self, client):
         """Test getting headers without authentication."""
         headers = client._get_headers(use_auth=False)
 
         assert headers["Content-Type"] == "application/json"
+        assert "gzip" in headers["Accept-Encoding"]
         assert "Authorization" not in headers
 
     def test_get_headers_with_auth(self, client):
@@ -191,27 +384,48 @@ class TestBankingClient:
         assert headers["Content-Type"] == "application/json"
         assert headers["Authorization"] == "Bearer test_token_123"
 
-    @patch('banking_client.requests.Session')
-    def test_transfer_success(self, mock_session_class, client):
-        """Test successful transfer."""
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "transactionId": "tx123",
-            "status": "SUCCESS",
-            "message": "Transfer completed",
+    def test_get_headers_rebuilt_on_token_change(self, client):
+        """Test header mappings are reused until the token changes."""
+        client.token = "first"
+        headers = client._get_headers(use_auth=True)
+
+        assert client._get_headers(use_auth=True) is headers
+        with pytest.raises(TypeError):
+            headers["Authorization"] = "Bearer other"
+
+        client.token = "second"
+        assert client._auth_header_value == "Bearer second"
+        assert client._get_headers(use_auth=True)["Authorization"] == "Bearer second"
+
+        client.token = None
+        assert client._auth_header_value is None
+        assert "Authorization" not in client._get_headers(use_auth=True)
+
+    @pytest.mark.parametrize("call,check", [
+        (lambda c: c.transfer("ACC1000", "ACC1001", 100.0, use_auth=False),
+         lambda r: (r.transaction_id, r.status, r.amount) == ("tx123", "SUCCESS", 100.0)),
+        (lambda c: c.validate_account("ACC1000"),
+         lambda r: r["accountId"] == "ACC1000" and r["isValid"] is True),
+        (lambda c: c.get_balance("ACC1000"),
+         lambda r: r["accountId"] == "ACC1000" and r["balance"] == 1000.0),
+        (lambda c: c.list_accounts(),
+         lambda r: len(r["accounts"]) == 2),
+    ], ids=["transfer", "validate_account", "get_balance", "list_accounts"])
+    def test_endpoint_success(self, client, mocked_api, call, check):
+        """Test successful calls to each endpoint."""
+        assert check(call(client))
+
+    def test_transfer_request_body(self, client, mocked_api):
+        """Test transfer serializes the request body with orjson."""
+        client.transfer("ACC1000", "ACC1001", 100.0, use_auth=False)
+
+        request = mocked_api.last_request
+        assert orjson.loads(request.body) == {
             "fromAccount": "ACC1000",
             "toAccount": "ACC1001",
             "amount": 100.0
         }
-        mock_response.raise_for_status = Mock()
-
-        client.session.post = Mock(return_value=mock_response)
-
-        result = client.transfer("ACC1000", "ACC1001", 100.0, use_auth=False)
-
-        assert result.transaction_id == "tx123"
-        assert result.status == "SUCCESS"
-        assert result.amount == 100.0
+        assert request.headers["Content-Type"] == "application/json"
 
     def test_transfer_invalid_amount(self, client):
         """Test transfer with invalid amount."""
@@ -223,65 +437,53 @@ class TestBankingClient:
         with pytest.raises(ValueError, match="Invalid from_account format"):
             client.transfer("INVALID", "ACC1001", 100.0)
 
-    @patch('banking_client.requests.Session')
-    def test_validate_account_success(self, mock_session_class, client):
-        """Test successful account validation."""
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "accountId": "ACC1000",
-            "isValid": True,
-            "accountType": "VALID_ACCOUNT",
-            "status": "ACTIVE"
-        }
-        mock_response.raise_for_status = Mock()
-
-        client.session.get = Mock(return_value=mock_response)
-
-        result = client.validate_account("ACC1000")
-
-        assert result["accountId"] == "ACC1000"
-        assert result["isValid"] is True
+    def test_get_balance_reuses_prepared_request(self, client, make_response):
+        """Test balance requests are prepared once per account and token."""
+        client.session = Session()
+        mock_response = make_response({"accountId": "ACC1000", "balance": 1.0})
+        client.session.send = Mock(return_value=mock_response)
 
-    @patch('banking_client.requests.Session')
-    def test_get_balance_success(self, mock_session_class, client):
-        """Test successful get balance."""
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "accountId": "ACC1000",
-            "balance": 1000.0,
-            "currency": "USD"
-        }
-        mock_response.raise_for_status = Mock()
+        client.get_balance("ACC1000")
+        client.get_balance("ACC1000")
 
-        client.session.get = Mock(return_value=mock_response)
+        first, second = client.session.send.call_args_list
+        assert first[0][0] is second[0][0]
+        assert first[0][0].url == "http://localhost:8123/accounts/balance/ACC1000"
 
-        result = client.get_balance("ACC1000")
+        client.token = "new_token"
+        client.get_balance("ACC1000", use_auth=True)
 
-        assert result["accountId"] == "ACC1000"
-        assert result["balance"] == 1000.0
+        prepared = client.session.send.call_args[0][0]
+        assert prepared is not first[0][0]
+        assert prepared.headers["Authorization"] == "Bearer new_token"
 
-    @patch('banking_client.requests.Session')
-    def test_list_accounts_success(self, mock_session_class, client):
-        """Test successful list accounts."""
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "accounts": [
-                {"accountId": "ACC1000", "status": "ACTIVE"},
-                {"accountId": "ACC1001", "status": "ACTIVE"}
+    def test_get_transaction_history_columns(self, client, make_response, frozen_clock):
+        """Test transaction history is split into columns."""
+        client.token = "valid_token"
+        client.token_expiry = frozen_clock["future"]
+
+        mock_response = make_response({
+            "transactions": [
+                {"transactionId": "tx1", "fromAccount": "ACC1000", "toAccount": "ACC1001",
+                 "amount": 10.5, "status": "SUCCESS", "timestamp": "2024-01-01T12:00:00"},
+                {"transactionId": "tx2", "fromAccount": "ACC1002", "toAccount": "ACC1003",
+                 "amount": 20.0, "status": "SUCCESS"}
             ]
-        }
-        mock_response.raise_for_status = Mock()
-
+        })
         client.session.get = Mock(return_value=mock_response)
 
-        result = client.list_accounts()
+        history = client.get_transaction_history_columns()
 
-        assert len(result["accounts"]) == 2
+        assert len(history) == 2
+        assert history.transaction_ids == ["tx1", "tx2"]
+        assert list(history.amounts) == [10.5, 20.0]
+        assert history.total_amount == 30.5
+        assert history.timestamps == ["2024-01-01T12:00:00", None]
 
-    def test_ensure_authenticated_with_valid_token(self, client):
+    def test_ensure_authenticated_with_valid_token(self, client, frozen_clock):
         """Test ensure_authenticated with valid token."""
         client.token = "valid_token"
-        client.token_expiry = datetime.now() + timedelta(hours=1)
+        client.token_expiry = frozen_clock["future"]
 
         # Should not raise or re-authenticate
         client._ensure_authenticated()
@@ -289,10 +491,10 @@ class TestBankingClient:
         assert client.token == "valid_token"
 
     @patch.object(BankingClient, 'authenticate')
-    def test_ensure_authenticated_with_expired_token(self, mock_auth, client):
+    def test_ensure_authenticated_with_expired_token(self, mock_auth, client, frozen_clock):
         """Test ensure_authenticated with expired token."""
         client.token = "expired_token"
-        client.token_expiry = datetime.now() - timedelta(hours=1)
+        client.token_expiry = frozen_clock["past"]
 
         mock_auth.return_value = "new_token"
 
@@ -300,45 +502,190 @@ class TestBankingClient:
 
         mock_auth.assert_called_once()
 
+    @pytest.mark.usefixtures("shared_session")
     def test_context_manager(self):
         """Test client as context manager."""
         with BankingClient() as client:
             assert client.session is not None
 
-        # Session should be closed after exiting context
+        # Exiting leaves the shared session open for other clients
+        client.session.close.assert_not_called()
+        assert BankingClient().session is client.session
 
-    def test_close(self, client):
-        """Test closing the client."""
-        mock_session = Mock()
-        client.session = mock_session
+    def test_create_session_uses_config(self):
+        """Test pool and retry settings come from the configuration."""
+        config = BankingConfig(max_retries=5, backoff_factor=0.5,
+                               pool_connections=4, pool_maxsize=64)
 
-        client.close()
+        adapter = _create_session(config).get_adapter("http://localhost:8123")
 
-        mock_session.close.assert_called_once()
+        assert adapter.max_retries.total == 5
+        assert adapter.max_retries.backoff_factor == 0.5
+        assert adapter._pool_connections == 4
+        assert adapter._pool_maxsize == 64
 
+    def test_sessions_share_ssl_context(self):
+        """Test default-verified pools share one SSL context and other modes get their own."""
+        request = requests.Request("GET", "https://localhost:8123").prepare()
+        first = _create_session().get_adapter("https://localhost:8123")
+        second = _create_session().get_adapter("https://localhost:8123")
 
-class TestIntegration:
-    """Integration tests (require running server)."""
+        _, pool_kwargs = first.build_connection_pool_key_attributes(request, True)
+        assert pool_kwargs["ssl_context"] is _ssl_context(DEFAULT_CA_BUNDLE_PATH)
+        _, pool_kwargs = second.build_connection_pool_key_attributes(request, True)
+        assert pool_kwargs["ssl_context"] is _ssl_context(DEFAULT_CA_BUNDLE_PATH)
 
-    @pytest.fixture
-    def live_client(self):
-        """Create a client connected to live server."""
-        return BankingClient(base_url="http://localhost:8123")
+        _, pool_kwargs = first.build_connection_pool_key_attributes(
+            request, DEFAULT_CA_BUNDLE_PATH
+        )
+        assert pool_kwargs["ssl_context"] is _ssl_context(DEFAULT_CA_BUNDLE_PATH)
+        assert "ca_certs" not in pool_kwargs
+
+        for verify, cert in [(False, None), ("/path/ca.pem", None), (True, "client.pem")]:
+            _, pool_kwargs = first.build_connection_pool_key_attributes(request, verify, cert)
+            assert "ssl_context" not in pool_kwargs
+
+    def test_shared_ssl_context_not_reloaded_per_connection(self, tls_server, monkeypatch):
+        """Test new connections reuse the shared context without reloading its CA bundle."""
+        url, ca_path = tls_server
+        context = ssl.create_default_context(cafile=ca_path)
+        context.load_verify_locations = Mock(wraps=context.load_verify_locations)
+        monkeypatch.setenv("REQUESTS_CA_BUNDLE", ca_path)
+        monkeypatch.delenv("CURL_CA_BUNDLE", raising=False)
+        session = _create_session(BankingConfig(max_retries=0))
+        untrusting_env = _create_session(BankingConfig(max_retries=0))
+        untrusting_env.trust_env = False
+
+        # The stub server closes every connection, so each request opens a new one
+        with patch.object(banking_client, "_ssl_context", return_value=context):
+            assert session.get(url).status_code == 200
+            assert session.get(url).status_code == 200
+            assert session.get(url, verify=ca_path).status_code == 200
+            assert untrusting_env.get(url).status_code == 200
+
+        context.load_verify_locations.assert_not_called()
+
+    @pytest.mark.filterwarnings("ignore::urllib3.exceptions.InsecureRequestWarning")
+    def test_verify_false_request(self, tls_server):
+        """Test verify=False still works with the shared SSL context in place."""
+        url, _ = tls_server
+        session = _create_session(BankingConfig(max_retries=0))
+
+        assert session.get(url, verify=False).status_code == 200
+
+    def test_custom_ca_bundle_does_not_leak(self, tls_server):
+        """Test a custom CA bundle is trusted only by the request that passes it."""
+        url, ca_path = tls_server
+        config = BankingConfig(max_retries=0)
+
+        assert _create_session(config).get(url, verify=ca_path).status_code == 200
+
+        with pytest.raises(requests.exceptions.SSLError):
+            _create_session(config).get(url)
+
+    def test_create_session_caches_get_responses(self):
+        """Test sessions cache GET responses when requests-cache is installed."""
+        requests_cache = pytest.importorskip("requests_cache")
+
+        session = _create_session()
+
+        assert isinstance(session, requests_cache.CachedSession)
+        assert session.settings.allowable_methods == ("GET",)
+        assert session.settings.match_headers == ["Authorization"]
+
+    @staticmethod
+    def _cached_session_with_mock():
+        """Build a cached session whose transport echoes the Authorization header."""
+        session = _create_session()
+        adapter = requests_mock.Adapter()
+        adapter.register_uri(
+            requests_mock.ANY, requests_mock.ANY,
+            json=lambda request, context: {"auth": request.headers.get("Authorization")}
+        )
+        session.mount("http://", adapter)
+        return session, adapter
+
+    def test_response_cache_keyed_on_token(self):
+        """Test clients with different tokens never share cached responses."""
+        pytest.importorskip("requests_cache")
+        session, adapter = self._cached_session_with_mock()
+        client_a = BankingClient(session=session)
+        client_a.token = "token-a"
+        client_b = BankingClient(session=session)
+        client_b.token = "token-b"
+
+        assert client_a.get_balance("ACC1000", use_auth=True) == {"auth": "Bearer token-a"}
+        assert client_b.get_balance("ACC1000", use_auth=True) == {"auth": "Bearer token-b"}
+        assert client_b.get_balance("ACC1000") == {"auth": None}
+        # Repeats are served from each caller's own entry
+        assert client_a.get_balance("ACC1000", use_auth=True) == {"auth": "Bearer token-a"}
+        assert adapter.call_count == 3
+        assert len(list(session.cache.responses.keys())) == 3
+
+    def test_response_cache_limited_to_account_lookups(self):
+        """Test only list, validate and balance responses are cached."""
+        pytest.importorskip("requests_cache")
+        session, adapter = self._cached_session_with_mock()
+        client = BankingClient(session=session)
+        client.token = "token-a"
+
+        for _ in range(2):
+            client.list_accounts()
+            client.validate_account("ACC1000")
+            client.get_balance("ACC1000")
+            client.get_transaction_history()
+
+        # Three lookups cached after the first pass, history fetched both times
+        assert adapter.call_count == 5
+
+    def test_transfer_clears_response_cache(self, make_response):
+        """Test a successful transfer drops cached GET responses."""
+        pytest.importorskip("requests_cache")
+        client = BankingClient(session=_create_session())
+
+        mock_response = make_response({"transactionId": "tx123", "status": "SUCCESS"})
+
+        with patch.object(client.session, "post", return_value=mock_response), \
+                patch.object(client.session.cache, "clear") as mock_clear:
+            client.transfer("ACC1000", "ACC1001", 100.0, use_auth=False)
+
+        mock_clear.assert_called_once()
+
+    def test_session_created_lazily(self):
+        """Test the shared session is only fetched on first use."""
+        with patch('banking_client._get_shared_session') as mock_get:
+            client = BankingClient()
+            mock_get.assert_not_called()
+
+            assert client.session is mock_get.return_value
+            assert client.session is mock_get.return_value
+
+        mock_get.assert_called_once()
+
+    @pytest.mark.usefixtures("shared_session")
+    def test_clients_share_session(self):
+        """Test that clients without an explicit session share one pool."""
+        assert BankingClient().session is BankingClient().session
+
+    def test_close(self, client, mock_session):
+        """Test closing the client leaves the session open for reuse."""
+        client.session = mock_session
+
+        client.close()
+
+        mock_session.close.assert_not_called()
+
+    @pytest.mark.usefixtures("shared_session")
+    def test_close_shared_session(self):
+        """Test closing the shared session forces a fresh one."""
+        session = BankingClient().session
 
-    @pytest.mark.integration
-    def test_validate_account_integration(self, live_client):
-        """Integration test for account validation."""
-        result = live_client.validate_account("ACC1000")
-        assert result["isValid"] is True
+        close_shared_session()
 
-    @pytest.mark.integration
-    def test_transfer_integration(self, live_client):
-        """Integration test for transfer."""
-        result = live_client.transfer("ACC1000", "ACC1001", 10.0, use_auth=False)
-        assert result.status == "SUCCESS"
-        assert result.amount == 10.0
+        session.close.assert_called_once()
+        assert BankingClient().session is not session
 
 
 # Run tests with: pytest test_banking_client.py -v
 # Run with coverage: pytest test_banking_client.py -v --cov=banking_client --cov-report=html
-# Skip integration tests: pytest test_banking_client.py -v -m "not integration"
+# Integration tests: pytest --integration tests/integration
@@ -0,0 +1,82 @@
+"""
+Tests for the command-line interface.
+Commands run against a local stub of the banking server.
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import cli
+from async_banking_client import _BULK_VALIDATE_UNSUPPORTED
+
+
+class StubBankingHandler(BaseHTTPRequestHandler):
+    """
+    Minimal stand-in for the bundled banking server.
+
+    Like the real server, a route it lacks (POST /accounts/validate/bulk)
+    is answered with 500 by its catch-all exception handler.
+    """
+
+    def do_GET(self):
+        self.server.requests.append(("GET", self.path))
+        account_id = self.path.rsplit("/", 1)[-1]
+        self._reply(200, {"accountId": account_id, "isValid": account_id != "ACC2000",
+                          "accountType": "VALID_ACCOUNT", "status": "ACTIVE"})
+
+    def do_POST(self):
+        self.server.requests.append(("POST", self.path))
+        self._reply(500, {"status": "FAILED",
+                          "error": "An unexpected error occurred: "
+                                   "Request method 'POST' is not supported"})
+
+    def _reply(self, status, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    """Run the stub banking server on a free local port."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubBankingHandler)
+    server.requests = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    _BULK_VALIDATE_UNSUPPORTED.clear()
+
+
+class TestValidateCommand:
+    """Test cases for the validate command."""
+
+    def test_validate_several_accounts_without_bulk_endpoint(self, stub_server, capsys,
+                                                             monkeypatch):
+        """Test several accounts validate individually when the bulk route fails."""
+        url = f"http://127.0.0.1:{stub_server.server_port}"
+        monkeypatch.setattr("sys.argv", ["cli.py", "--url", url, "validate",
+                                         "--account", "ACC1000", "ACC2000"])
+
+        assert cli.main() == 0
+
+        out = capsys.readouterr().out
+        assert "Account ID: ACC1000" in out
+        assert "Account ID: ACC2000" in out
+        # One bulk probe, not retried, then one lookup per account
+        assert stub_server.requests.count(("POST", "/accounts/validate/bulk")) == 1
+        assert url in _BULK_VALIDATE_UNSUPPORTED
+        assert sorted(r for r in stub_server.requests if r[0] == "GET") == [
+            ("GET", "/accounts/validate/ACC1000"),
+            ("GET", "/accounts/validate/ACC2000"),
+        ]
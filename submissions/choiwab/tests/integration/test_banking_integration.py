@@ -0,0 +1,32 @@
+"""
+Integration tests for Banking Client.
+Require a running banking server; collected only with 'pytest --integration'.
+"""
+
+import pytest
+
+from banking_client import BankingClient
+
+
+@pytest.fixture(scope="session")
+def live_client():
+    """Create a client connected to live server."""
+    return BankingClient(base_url="http://localhost:8123")
+
+
+@pytest.mark.serial
+class TestIntegration:
+    """Integration tests (require running server)."""
+
+    @pytest.mark.integration
+    def test_validate_account_integration(self, live_client):
+        """Integration test for account validation."""
+        result = live_client.validate_account("ACC1000")
+        assert result["isValid"] is True
+
+    @pytest.mark.integration
+    def test_transfer_integration(self, live_client):
+        """Integration test for transfer."""
+        result = live_client.transfer("ACC1000", "ACC1001", 10.0, use_auth=False)
+        assert result.status == "SUCCESS"
+        assert result.amount == 10.0